@@ -0,0 +1,77 @@
+"""
+Shared bulk-import settings and CSV helpers for the Neo4j loaders
+Used by neo4j_loader.py (data/processed/*.csv) and neo4j_knowledge_graph.py (data/*.csv)
+"""
+
+from typing import Dict
+
+import pandas as pd
+
+# Rows sent per UNWIND statement, and statements grouped into one commit
+BATCH_SIZE = 1000
+COMMIT_BATCHES = 10
+
+# Above this many rows, imports let the server commit periodically
+# (CALL {} IN TRANSACTIONS) so one transaction can't exhaust the heap
+LARGE_IMPORT_ROWS = 100_000
+
+# Explicit CSV schemas so the pyarrow reader skips type inference. The dtypes
+# themselves must be Arrow-backed: plain 'string'/'float64' would override
+# dtype_backend='pyarrow' and hand back Python strings and numpy floats.
+_STR = 'string[pyarrow]'
+_FLOAT = 'double[pyarrow]'
+
+# data/processed/*.csv, loaded by neo4j_loader.py
+PROCESSED_ENTITY_DTYPES = {
+    'id': _STR, 'name': _STR, 'type': _STR, 'category': _STR,
+    'parent_ministry': _STR, 'website': _STR, 'description': _STR,
+    'location': _STR, 'latitude': _FLOAT, 'longitude': _FLOAT
+}
+PROCESSED_PEOPLE_DTYPES = {
+    'id': _STR, 'name': _STR, 'position': _STR, 'entity': _STR,
+    'email': _STR, 'phone': _STR, 'background': _STR
+}
+PROCESSED_PARTNER_DTYPES = {
+    'id': _STR, 'company_name': _STR, 'sector': _STR,
+    'govt_entity': _STR, 'project_name': _STR, 'start_date': _STR,
+    'status': _STR, 'value_rm': _FLOAT
+}
+
+# data/*.csv, loaded by neo4j_knowledge_graph.py
+ENTITY_DTYPES = {
+    'entity_id': _STR, 'name': _STR, 'entity_type': _STR,
+    'mandate': _STR, 'state': _STR, 'parent_org': _STR,
+    'policy_alignment': _STR, 'latitude': _FLOAT, 'longitude': _FLOAT
+}
+PEOPLE_DTYPES = {
+    'person_id': _STR, 'entity_id': _STR, 'name': _STR,
+    'title': _STR, 'role_type': _STR, 'focus_area': _STR,
+    'email': _STR, 'source': _STR, 'confidence_score': _FLOAT
+}
+PARTNER_DTYPES = {
+    'partner_id': _STR, 'entity_id': _STR, 'company_name': _STR,
+    'focus_area': _STR, 'relationship_type': _STR,
+    'procurement_stage': _STR, 'contract_year': _STR,
+    'contract_value_rm': _FLOAT
+}
+
+
+def read_csv_fast(path: str, dtypes: Dict) -> pd.DataFrame:
+    """Read a CSV with the multi-threaded pyarrow parser into Arrow-backed columns"""
+    return pd.read_csv(path, engine='pyarrow', dtype_backend='pyarrow', dtype=dtypes)
+
+
+def unwind_query(param: str, var: str, body: str) -> str:
+    """`UNWIND $param AS var` followed by the per-row Cypher body"""
+    return f"UNWIND ${param} AS {var}\n{body}"
+
+
+def unwind_in_transactions(param: str, var: str, body: str, batch_size: int = BATCH_SIZE) -> str:
+    """Same as unwind_query, but the server commits every batch_size rows.
+
+    Must be sent as an auto-commit transaction (plain session.run).
+    """
+    return (
+        f"UNWIND ${param} AS {var}\n"
+        f"CALL {{\n    WITH {var}\n{body}\n}} IN TRANSACTIONS OF {batch_size} ROWS"
+    )
@@ -37,7 +37,7 @@ class Neo4jConnector:
             LIMIT {limit}
             """
             nodes_result = session.run(nodes_query)
-            nodes = [dict(record) for record in nodes_result]
+            nodes = nodes_result.data()
 
             # Get node IDs for relationship filtering
             node_ids = [node['id'] for node in nodes]
@@ -52,7 +52,7 @@ class Neo4jConnector:
                    properties(r) as properties
             """
             rels_result = session.run(rels_query, node_ids=node_ids)
-            relationships = [dict(record) for record in rels_result]
+            relationships = rels_result.data()
 
             return nodes, relationships
     
@@ -102,7 +102,7 @@ class Neo4jConnector:
                 ORDER BY connections DESC
                 LIMIT 10
             """)
-            stats['most_connected'] = [dict(record) for record in most_connected]
+            stats['most_connected'] = most_connected.data()
 
             return stats
     
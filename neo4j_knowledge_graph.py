@@ -6,11 +6,19 @@ Complete implementation with data import, queries, and dashboard integration
 from neo4j import GraphDatabase
 import pandas as pd
 import logging
+from collections import Counter
 from typing import List, Dict
 import json
 
+from neo4j_common import (
+    BATCH_SIZE, COMMIT_BATCHES, LARGE_IMPORT_ROWS,
+    ENTITY_DTYPES, PEOPLE_DTYPES, PARTNER_DTYPES,
+    read_csv_fast, unwind_query, unwind_in_transactions
+)
+
 logging.basicConfig(level=logging.INFO)
 
+
 class GovernmentKnowledgeGraph:
     """
     Manage Neo4j Knowledge Graph for Government Entities
@@ -33,52 +41,107 @@ class GovernmentKnowledgeGraph:
             session.run("MATCH (n) DETACH DELETE n")
             logging.info("Database cleared")
     
-    def create_constraints(self):
-        """Create uniqueness constraints and indexes"""
-        constraints = [
-            "CREATE CONSTRAINT entity_id IF NOT EXISTS FOR (e:Entity) REQUIRE e.entity_id IS UNIQUE",
-            "CREATE CONSTRAINT person_id IF NOT EXISTS FOR (p:Person) REQUIRE p.person_id IS UNIQUE",
-            "CREATE CONSTRAINT company_id IF NOT EXISTS FOR (c:Company) REQUIRE c.partner_id IS UNIQUE",
-            "CREATE CONSTRAINT policy_name IF NOT EXISTS FOR (pol:Policy) REQUIRE pol.name IS UNIQUE",
-            
-            # Indexes for common queries
-            "CREATE INDEX entity_name IF NOT EXISTS FOR (e:Entity) ON (e.name)",
-            "CREATE INDEX person_name IF NOT EXISTS FOR (p:Person) ON (p.name)",
-            "CREATE INDEX company_name IF NOT EXISTS FOR (c:Company) ON (c.name)",
-        ]
-        
+    # Uniqueness constraints back the MERGE lookups, so they must exist before import.
+    # Secondary indexes only serve read queries and are built once the data is loaded.
+    UNIQUENESS_CONSTRAINTS = [
+        "CREATE CONSTRAINT entity_id IF NOT EXISTS FOR (e:Entity) REQUIRE e.entity_id IS UNIQUE",
+        "CREATE CONSTRAINT person_id IF NOT EXISTS FOR (p:Person) REQUIRE p.person_id IS UNIQUE",
+        "CREATE CONSTRAINT company_id IF NOT EXISTS FOR (c:Company) REQUIRE c.partner_id IS UNIQUE",
+        "CREATE CONSTRAINT policy_name IF NOT EXISTS FOR (pol:Policy) REQUIRE pol.name IS UNIQUE",
+    ]
+    
+    SECONDARY_INDEXES = {
+        "entity_name": "CREATE INDEX entity_name IF NOT EXISTS FOR (e:Entity) ON (e.name)",
+        "person_name": "CREATE INDEX person_name IF NOT EXISTS FOR (p:Person) ON (p.name)",
+        "company_name": "CREATE INDEX company_name IF NOT EXISTS FOR (c:Company) ON (c.name)",
+    }
+    
+    def _run_schema_statements(self, statements):
         with self.driver.session() as session:
-            for constraint in constraints:
+            for statement in statements:
                 try:
-                    session.run(constraint)
-                    logging.info(f"Created: {constraint.split('FOR')[0]}")
+                    session.run(statement)
+                    logging.info(f"Executed: {statement.split('FOR')[0]}")
                 except Exception as e:
-                    logging.warning(f"Constraint might already exist: {e}")
+                    logging.warning(f"Schema statement skipped: {e}")
+    
+    def create_uniqueness_constraints(self):
+        """Create the uniqueness constraints required for MERGE correctness"""
+        self._run_schema_statements(self.UNIQUENESS_CONSTRAINTS)
+    
+    def create_secondary_indexes(self):
+        """Create lookup indexes for common queries (run after bulk import)"""
+        self._run_schema_statements(self.SECONDARY_INDEXES.values())
+        # Indexes populate in the background; wait so later queries don't fall back to label scans
+        with self.driver.session() as session:
+            session.run("CALL db.awaitIndexes()").consume()
+        logging.info("Indexes online")
+    
+    def drop_secondary_indexes(self):
+        """Drop lookup indexes so a bulk import doesn't maintain them row by row"""
+        self._run_schema_statements(
+            f"DROP INDEX {name} IF EXISTS" for name in self.SECONDARY_INDEXES
+        )
+    
+    def create_constraints(self):
+        """Create uniqueness constraints and indexes"""
+        self.create_uniqueness_constraints()
+        self.create_secondary_indexes()
+    
+    @staticmethod
+    def _records(df: pd.DataFrame) -> List[Dict]:
+        """Convert a DataFrame to UNWIND rows with missing values as None"""
+        return df.astype(object).where(df.notna(), None).to_dict('records')
+    
+    @staticmethod
+    def _counters(summary) -> Counter:
+        """Nodes created, relationships created and properties set by one statement"""
+        counters = summary.counters
+        return Counter(
+            nodes_created=counters.nodes_created,
+            relationships_created=counters.relationships_created,
+            properties_set=counters.properties_set,
+        )
+    
+    @classmethod
+    def _run_batches(cls, tx, query, param, rows, batch_size=BATCH_SIZE) -> Counter:
+        """Run UNWIND batches in one transaction; total the summary counters"""
+        counts = Counter()
+        for i in range(0, len(rows), batch_size):
+            counts += cls._counters(tx.run(query, {param: rows[i:i + batch_size]}).consume())
+        return counts
+    
+    def _write_batches(self, param, var, body, rows) -> Counter:
+        """Write rows (`UNWIND $param AS var` + body) in batches, committing once per group of batches"""
+        if len(rows) > LARGE_IMPORT_ROWS:
+            return self._write_periodic(param, var, body, rows)
+        query = unwind_query(param, var, body)
+        group_size = BATCH_SIZE * COMMIT_BATCHES
+        counts = Counter()
+        with self.driver.session() as session:
+            for i in range(0, len(rows), group_size):
+                counts += session.execute_write(
+                    self._run_batches, query, param, rows[i:i + group_size]
+                )
+        return counts
+    
+    def _write_periodic(self, param, var, body, rows) -> Counter:
+        """Write very large row sets with server-side periodic commits"""
+        # IN TRANSACTIONS only runs in auto-commit transactions, i.e. plain session.run
+        periodic_query = unwind_in_transactions(param, var, body)
+        counts = Counter()
+        with self.driver.session() as session:
+            for i in range(0, len(rows), LARGE_IMPORT_ROWS):
+                summary = session.run(periodic_query, {param: rows[i:i + LARGE_IMPORT_ROWS]}).consume()
+                counts += self._counters(summary)
+        return counts
     
     def import_entities(self, entities_df: pd.DataFrame):
         """Import government entities as nodes"""
         logging.info(f"Importing {len(entities_df)} entities...")
         
+        # Plain MERGE; the type-specific labels need APOC (apoc.create.addLabels)
         query = """
-        UNWIND $entities AS entity
-        MERGE (e:Entity {entity_id: entity.entity_id})
-        SET e.name = entity.name,
-            e.entity_type = entity.entity_type,
-            e.mandate = entity.mandate,
-            e.state = entity.state,
-            e.latitude = toFloat(entity.latitude),
-            e.longitude = toFloat(entity.longitude),
-            e.created_at = datetime()
-        
-        // Create entity type-specific labels
-        WITH e, entity
-        CALL apoc.create.addLabels(e, [entity.entity_type]) YIELD node
-        RETURN count(node) as created
-        """
-        
-        # If APOC is not available, use simpler version:
-        query_simple = """
-        UNWIND $entities AS entity
         MERGE (e:Entity {entity_id: entity.entity_id})
         SET e.name = entity.name,
             e.entity_type = entity.entity_type,
@@ -87,15 +150,12 @@ class GovernmentKnowledgeGraph:
             e.latitude = toFloat(entity.latitude),
             e.longitude = toFloat(entity.longitude),
             e.created_at = datetime()
-        RETURN count(e) as created
         """
         
-        entities_data = entities_df.to_dict('records')
+        entities_data = self._records(entities_df)
         
-        with self.driver.session() as session:
-            result = session.run(query_simple, entities=entities_data)
-            count = result.single()['created']
-            logging.info(f"Created/updated {count} entity nodes")
+        counts = self._write_batches('entities', 'entity', query, entities_data)
+        logging.info(f"Created {counts['nodes_created']} entity nodes, set {counts['properties_set']} properties")
         
         # Create hierarchical relationships
         self._create_entity_hierarchy(entities_df)
@@ -108,12 +168,10 @@ class GovernmentKnowledgeGraph:
         logging.info("Creating organizational hierarchy...")
         
         query = """
-        UNWIND $relationships AS rel
         MATCH (child:Entity {entity_id: rel.child_id})
         MATCH (parent:Entity {entity_id: rel.parent_id})
         MERGE (child)-[r:REPORTS_TO]->(parent)
         SET r.created_at = datetime()
-        RETURN count(r) as created
         """
         
         # Filter entities with parent organizations
@@ -124,10 +182,8 @@ class GovernmentKnowledgeGraph:
         ]
         
         if relationships:
-            with self.driver.session() as session:
-                result = session.run(query, relationships=relationships)
-                count = result.single()['created']
-                logging.info(f"Created {count} hierarchical relationships")
+            counts = self._write_batches('relationships', 'rel', query, relationships)
+            logging.info(f"Created {counts['relationships_created']} hierarchical relationships")
     
     def _create_policy_alignments(self, entities_df: pd.DataFrame):
         """Create Policy nodes and ALIGNED_TO relationships"""
@@ -141,24 +197,19 @@ class GovernmentKnowledgeGraph:
         
         # Create policy nodes
         create_policy_query = """
-        UNWIND $policies AS policy_name
         MERGE (p:Policy {name: policy_name})
         SET p.created_at = datetime()
-        RETURN count(p) as created
         """
         
-        with self.driver.session() as session:
-            result = session.run(create_policy_query, policies=list(all_policies))
-            logging.info(f"Created {result.single()['created']} policy nodes")
+        counts = self._write_batches('policies', 'policy_name', create_policy_query, list(all_policies))
+        logging.info(f"Created {counts['nodes_created']} policy nodes")
         
         # Create alignment relationships
         alignment_query = """
-        UNWIND $alignments AS align
         MATCH (e:Entity {entity_id: align.entity_id})
         MATCH (p:Policy {name: align.policy_name})
         MERGE (e)-[r:ALIGNED_TO]->(p)
         SET r.created_at = datetime()
-        RETURN count(r) as created
         """
         
         alignments = []
@@ -171,17 +222,14 @@ class GovernmentKnowledgeGraph:
                         'policy_name': policy
                     })
         
-        with self.driver.session() as session:
-            result = session.run(alignment_query, alignments=alignments)
-            count = result.single()['created']
-            logging.info(f"Created {count} policy alignment relationships")
+        counts = self._write_batches('alignments', 'align', alignment_query, alignments)
+        logging.info(f"Created {counts['relationships_created']} policy alignment relationships")
     
     def import_people(self, people_df: pd.DataFrame):
         """Import people as nodes and create WORKS_FOR relationships"""
         logging.info(f"Importing {len(people_df)} people...")
         
         query = """
-        UNWIND $people AS person
         MERGE (p:Person {person_id: person.person_id})
         SET p.name = person.name,
             p.title = person.title,
@@ -191,24 +239,19 @@ class GovernmentKnowledgeGraph:
             p.email = person.email,
             p.source = person.source,
             p.created_at = datetime()
-        RETURN count(p) as created
         """
         
-        people_data = people_df.to_dict('records')
+        people_data = self._records(people_df)
         
-        with self.driver.session() as session:
-            result = session.run(query, people=people_data)
-            count = result.single()['created']
-            logging.info(f"Created/updated {count} person nodes")
+        counts = self._write_batches('people', 'person', query, people_data)
+        logging.info(f"Created {counts['nodes_created']} person nodes, set {counts['properties_set']} properties")
         
         # Create WORKS_FOR relationships
         works_for_query = """
-        UNWIND $relationships AS rel
         MATCH (p:Person {person_id: rel.person_id})
         MATCH (e:Entity {entity_id: rel.entity_id})
         MERGE (p)-[r:WORKS_FOR]->(e)
         SET r.created_at = datetime()
-        RETURN count(r) as created
         """
         
         relationships = [
@@ -216,34 +259,27 @@ class GovernmentKnowledgeGraph:
             for _, row in people_df.iterrows()
         ]
         
-        with self.driver.session() as session:
-            result = session.run(works_for_query, relationships=relationships)
-            count = result.single()['created']
-            logging.info(f"Created {count} WORKS_FOR relationships")
+        counts = self._write_batches('relationships', 'rel', works_for_query, relationships)
+        logging.info(f"Created {counts['relationships_created']} WORKS_FOR relationships")
     
     def import_partners(self, partners_df: pd.DataFrame):
         """Import private sector partners and create relationships"""
         logging.info(f"Importing {len(partners_df)} partners...")
         
         query = """
-        UNWIND $partners AS partner
         MERGE (c:Company {partner_id: partner.partner_id})
         SET c.name = partner.company_name,
             c.focus_area = partner.focus_area,
             c.created_at = datetime()
-        RETURN count(c) as created
         """
         
-        partners_data = partners_df.to_dict('records')
+        partners_data = self._records(partners_df)
         
-        with self.driver.session() as session:
-            result = session.run(query, partners=partners_data)
-            count = result.single()['created']
-            logging.info(f"Created/updated {count} company nodes")
+        counts = self._write_batches('partners', 'partner', query, partners_data)
+        logging.info(f"Created {counts['nodes_created']} company nodes, set {counts['properties_set']} properties")
         
         # Create PARTNERS_WITH relationships
         partnership_query = """
-        UNWIND $relationships AS rel
         MATCH (c:Company {partner_id: rel.partner_id})
         MATCH (e:Entity {entity_id: rel.entity_id})
         MERGE (c)-[r:PARTNERS_WITH]->(e)
@@ -252,191 +288,189 @@ class GovernmentKnowledgeGraph:
             r.contract_year = toInteger(rel.contract_year),
             r.procurement_stage = rel.procurement_stage,
             r.created_at = datetime()
-        RETURN count(r) as created
         """
         
-        relationships = partners_df.to_dict('records')
+        relationships = self._records(partners_df)
         
-        with self.driver.session() as session:
-            result = session.run(partnership_query, relationships=relationships)
-            count = result.single()['created']
-            logging.info(f"Created {count} PARTNERS_WITH relationships")
+        counts = self._write_batches('relationships', 'rel', partnership_query, relationships)
+        logging.info(f"Created {counts['relationships_created']} PARTNERS_WITH relationships")
     
     # ========================================================================
     # QUERY METHODS - Common use cases
     # ========================================================================
     
+    # Static Cypher is declared once so every call sends the identical string
+    _Q_FIND_ENTITY_BY_NAME = """
+    MATCH (e:Entity)
+    WHERE toLower(e.name) CONTAINS toLower($name)
+    RETURN e.entity_id as id, e.name as name, e.entity_type as type, 
+           e.mandate as mandate
+    """
+    
+    _Q_ENTITY_HIERARCHY = """
+    MATCH path = (e:Entity {entity_id: $entity_id})-[:REPORTS_TO*0..]->(parent)
+    WITH e, collect(parent) as parents
+    MATCH (child)-[:REPORTS_TO*0..]->(e)
+    RETURN e.name as entity_name,
+           [p in parents | {name: p.name, id: p.entity_id, type: p.entity_type}] as parents,
+           collect({name: child.name, id: child.entity_id, type: child.entity_type}) as children
+    """
+    
+    _Q_KEY_PEOPLE_FOR_ENTITY = """
+    MATCH (p:Person)-[:WORKS_FOR]->(e:Entity {entity_id: $entity_id})
+    RETURN p.name as name, p.title as title, p.role_type as role,
+           p.focus_area as focus, p.email as email, p.confidence_score as confidence
+    ORDER BY p.confidence_score DESC
+    """
+    
+    _Q_PARTNERS_FOR_ENTITY = """
+    MATCH (c:Company)-[r:PARTNERS_WITH]->(e:Entity {entity_id: $entity_id})
+    RETURN c.name as company, r.relationship_type as relationship,
+           r.contract_value_rm as value, r.contract_year as year,
+           r.procurement_stage as stage
+    ORDER BY r.contract_value_rm DESC
+    """
+    
+    _Q_ENTITIES_BY_POLICY = """
+    MATCH (e:Entity)-[:ALIGNED_TO]->(p:Policy {name: $policy_name})
+    RETURN e.entity_id as id, e.name as name, e.entity_type as type,
+           e.mandate as mandate
+    ORDER BY e.entity_type, e.name
+    """
+    
+    _Q_DECISION_MAKERS_FOR_FOCUS_AREA = """
+    MATCH (p:Person)-[:WORKS_FOR]->(e:Entity)
+    WHERE toLower(p.focus_area) CONTAINS toLower($focus_area)
+      AND p.role_type IN ['Political', 'Executive']
+    RETURN p.name as name, p.title as title, p.focus_area as focus,
+           e.name as organization, p.email as email, p.confidence_score as confidence
+    ORDER BY p.confidence_score DESC
+    LIMIT 20
+    """
+    
+    _Q_COMPANY_GOVERNMENT_NETWORK = """
+    MATCH (c:Company)-[r:PARTNERS_WITH]->(e:Entity)
+    WHERE toLower(c.name) CONTAINS toLower($company_name)
+    RETURN c.name as company,
+           collect({
+               entity: e.name,
+               type: e.entity_type,
+               relationship: r.relationship_type,
+               value: r.contract_value_rm,
+               year: r.contract_year
+           }) as partnerships
+    """
+    
+    _Q_PROCUREMENT_FLOW = """
+    MATCH (c:Company)-[r:PARTNERS_WITH]->(e:Entity)
+    WHERE r.contract_value_rm >= $min_value
+    RETURN e.name as source, c.name as target, 
+           r.contract_value_rm as value, r.relationship_type as type
+    ORDER BY r.contract_value_rm DESC
+    """
+    
+    _Q_MYDIGITAL_ECOSYSTEM = """
+    MATCH (e:Entity)-[:ALIGNED_TO]->(p:Policy {name: 'MyDIGITAL'})
+    OPTIONAL MATCH (person:Person)-[:WORKS_FOR]->(e)
+    OPTIONAL MATCH (company:Company)-[:PARTNERS_WITH]->(e)
+    RETURN e.name as entity,
+           e.entity_type as type,
+           count(DISTINCT person) as key_people,
+           count(DISTINCT company) as partners,
+           sum(CASE WHEN company IS NOT NULL THEN 1 ELSE 0 END) as total_partnerships
+    ORDER BY key_people DESC, partners DESC
+    """
+    
+    _Q_SHORTEST_PATH_TO_DECISION_MAKER = """
+    MATCH (start:Entity {entity_id: $start_entity_id})
+    MATCH (target:Person)
+    WHERE toLower(target.focus_area) CONTAINS toLower($target_focus)
+      AND target.role_type IN ['Political', 'Executive']
+    MATCH path = shortestPath((start)-[:REPORTS_TO|WORKS_FOR|PARTNERS_WITH|ALIGNED_TO*..5]-(target))
+    RETURN [node in nodes(path) | 
+            CASE 
+                WHEN 'Entity' IN labels(node) THEN {type: 'Entity', name: node.name}
+                WHEN 'Person' IN labels(node) THEN {type: 'Person', name: node.name, title: node.title}
+            END
+           ] as path,
+           length(path) as hops
+    ORDER BY hops
+    LIMIT 5
+    """
+    
+    _Q_GRAPH_STATISTICS = """
+    CALL { MATCH (e:Entity) RETURN count(e) as entities }
+    CALL { MATCH (p:Person) RETURN count(p) as people }
+    CALL { MATCH (c:Company) RETURN count(c) as companies }
+    CALL { MATCH (pol:Policy) RETURN count(pol) as policies }
+    CALL { MATCH ()-[r]->() RETURN count(r) as relationships }
+    RETURN entities, people, companies, policies, relationships
+    """
+    
     def find_entity_by_name(self, name: str) -> List[Dict]:
         """Find entity by name (fuzzy search)"""
-        query = """
-        MATCH (e:Entity)
-        WHERE toLower(e.name) CONTAINS toLower($name)
-        RETURN e.entity_id as id, e.name as name, e.entity_type as type, 
-               e.mandate as mandate
-        """
-        
         with self.driver.session() as session:
-            result = session.run(query, name=name)
-            return [dict(record) for record in result]
+            result = session.run(self._Q_FIND_ENTITY_BY_NAME, name=name)
+            return result.data()
     
     def get_entity_hierarchy(self, entity_id: str) -> Dict:
         """Get full hierarchy for an entity (parents and children)"""
-        query = """
-        MATCH path = (e:Entity {entity_id: $entity_id})-[:REPORTS_TO*0..]->(parent)
-        WITH e, collect(parent) as parents
-        MATCH (child)-[:REPORTS_TO*0..]->(e)
-        RETURN e.name as entity_name,
-               [p in parents | {name: p.name, id: p.entity_id, type: p.entity_type}] as parents,
-               collect({name: child.name, id: child.entity_id, type: child.entity_type}) as children
-        """
-        
         with self.driver.session() as session:
-            result = session.run(query, entity_id=entity_id)
+            result = session.run(self._Q_ENTITY_HIERARCHY, entity_id=entity_id)
             return dict(result.single())
     
     def get_key_people_for_entity(self, entity_id: str) -> List[Dict]:
         """Get all people working for an entity"""
-        query = """
-        MATCH (p:Person)-[:WORKS_FOR]->(e:Entity {entity_id: $entity_id})
-        RETURN p.name as name, p.title as title, p.role_type as role,
-               p.focus_area as focus, p.email as email, p.confidence_score as confidence
-        ORDER BY p.confidence_score DESC
-        """
-        
         with self.driver.session() as session:
-            result = session.run(query, entity_id=entity_id)
-            return [dict(record) for record in result]
+            result = session.run(self._Q_KEY_PEOPLE_FOR_ENTITY, entity_id=entity_id)
+            return result.data()
     
     def get_partners_for_entity(self, entity_id: str) -> List[Dict]:
         """Get all private sector partners for an entity"""
-        query = """
-        MATCH (c:Company)-[r:PARTNERS_WITH]->(e:Entity {entity_id: $entity_id})
-        RETURN c.name as company, r.relationship_type as relationship,
-               r.contract_value_rm as value, r.contract_year as year,
-               r.procurement_stage as stage
-        ORDER BY r.contract_value_rm DESC
-        """
-        
         with self.driver.session() as session:
-            result = session.run(query, entity_id=entity_id)
-            return [dict(record) for record in result]
+            result = session.run(self._Q_PARTNERS_FOR_ENTITY, entity_id=entity_id)
+            return result.data()
     
     def find_entities_by_policy(self, policy_name: str) -> List[Dict]:
         """Find all entities aligned to a specific policy"""
-        query = """
-        MATCH (e:Entity)-[:ALIGNED_TO]->(p:Policy {name: $policy_name})
-        RETURN e.entity_id as id, e.name as name, e.entity_type as type,
-               e.mandate as mandate
-        ORDER BY e.entity_type, e.name
-        """
-        
         with self.driver.session() as session:
-            result = session.run(query, policy_name=policy_name)
-            return [dict(record) for record in result]
+            result = session.run(self._Q_ENTITIES_BY_POLICY, policy_name=policy_name)
+            return result.data()
     
     def find_decision_makers_for_focus_area(self, focus_area: str) -> List[Dict]:
         """Find key decision makers in a specific focus area"""
-        query = """
-        MATCH (p:Person)-[:WORKS_FOR]->(e:Entity)
-        WHERE toLower(p.focus_area) CONTAINS toLower($focus_area)
-          AND p.role_type IN ['Political', 'Executive']
-        RETURN p.name as name, p.title as title, p.focus_area as focus,
-               e.name as organization, p.email as email, p.confidence_score as confidence
-        ORDER BY p.confidence_score DESC
-        LIMIT 20
-        """
-        
         with self.driver.session() as session:
-            result = session.run(query, focus_area=focus_area)
-            return [dict(record) for record in result]
+            result = session.run(self._Q_DECISION_MAKERS_FOR_FOCUS_AREA, focus_area=focus_area)
+            return result.data()
     
     def get_company_government_network(self, company_name: str) -> Dict:
         """Get all government entities a company works with"""
-        query = """
-        MATCH (c:Company)-[r:PARTNERS_WITH]->(e:Entity)
-        WHERE toLower(c.name) CONTAINS toLower($company_name)
-        RETURN c.name as company,
-               collect({
-                   entity: e.name,
-                   type: e.entity_type,
-                   relationship: r.relationship_type,
-                   value: r.contract_value_rm,
-                   year: r.contract_year
-               }) as partnerships
-        """
-        
         with self.driver.session() as session:
-            result = session.run(query, company_name=company_name)
+            result = session.run(self._Q_COMPANY_GOVERNMENT_NETWORK, company_name=company_name)
             return dict(result.single())
     
     def get_procurement_flow(self, min_value: int = 1000000) -> List[Dict]:
         """Get procurement flow for Sankey diagram"""
-        query = """
-        MATCH (c:Company)-[r:PARTNERS_WITH]->(e:Entity)
-        WHERE r.contract_value_rm >= $min_value
-        RETURN e.name as source, c.name as target, 
-               r.contract_value_rm as value, r.relationship_type as type
-        ORDER BY r.contract_value_rm DESC
-        """
-        
         with self.driver.session() as session:
-            result = session.run(query, min_value=min_value)
-            return [dict(record) for record in result]
+            result = session.run(self._Q_PROCUREMENT_FLOW, min_value=min_value)
+            return result.data()
     
     def get_mydigital_ecosystem(self) -> Dict:
         """Get complete MyDIGITAL ecosystem overview"""
-        query = """
-        MATCH (e:Entity)-[:ALIGNED_TO]->(p:Policy {name: 'MyDIGITAL'})
-        OPTIONAL MATCH (person:Person)-[:WORKS_FOR]->(e)
-        OPTIONAL MATCH (company:Company)-[:PARTNERS_WITH]->(e)
-        RETURN e.name as entity,
-               e.entity_type as type,
-               count(DISTINCT person) as key_people,
-               count(DISTINCT company) as partners,
-               sum(CASE WHEN company IS NOT NULL THEN 1 ELSE 0 END) as total_partnerships
-        ORDER BY key_people DESC, partners DESC
-        """
-        
         with self.driver.session() as session:
-            result = session.run(query)
-            return [dict(record) for record in result]
+            result = session.run(self._Q_MYDIGITAL_ECOSYSTEM)
+            return result.data()
     
     def find_shortest_path_to_decision_maker(self, start_entity_id: str, target_focus: str) -> List[Dict]:
         """Find shortest path from an entity to a decision maker in a focus area"""
-        query = """
-        MATCH (start:Entity {entity_id: $start_entity_id})
-        MATCH (target:Person)
-        WHERE toLower(target.focus_area) CONTAINS toLower($target_focus)
-          AND target.role_type IN ['Political', 'Executive']
-        MATCH path = shortestPath((start)-[*..5]-(target))
-        RETURN [node in nodes(path) | 
-                CASE 
-                    WHEN 'Entity' IN labels(node) THEN {type: 'Entity', name: node.name}
-                    WHEN 'Person' IN labels(node) THEN {type: 'Person', name: node.name, title: node.title}
-                END
-               ] as path,
-               length(path) as hops
-        ORDER BY hops
-        LIMIT 5
-        """
-        
         with self.driver.session() as session:
-            result = session.run(query, start_entity_id=start_entity_id, target_focus=target_focus)
-            return [dict(record) for record in result]
+            result = session.run(self._Q_SHORTEST_PATH_TO_DECISION_MAKER, start_entity_id=start_entity_id, target_focus=target_focus)
+            return result.data()
     
     def get_graph_statistics(self) -> Dict:
         """Get overall graph statistics"""
-        query = """
-        MATCH (e:Entity) WITH count(e) as entities
-        MATCH (p:Person) WITH entities, count(p) as people
-        MATCH (c:Company) WITH entities, people, count(c) as companies
-        MATCH (pol:Policy) WITH entities, people, companies, count(pol) as policies
-        MATCH ()-[r]->() WITH entities, people, companies, policies, count(r) as relationships
-        RETURN entities, people, companies, policies, relationships
-        """
-        
         with self.driver.session() as session:
-            result = session.run(query)
+            result = session.run(self._Q_GRAPH_STATISTICS)
             return dict(result.single())
 
 
@@ -463,6 +497,19 @@ def integrate_with_streamlit():
     
     kg = get_neo4j_connection()
     
+    # Cache query results so identical queries on rerun skip the Neo4j round-trip
+    @st.cache_data(ttl=300, show_spinner=False)
+    def find_entity_by_name(name):
+        return kg.find_entity_by_name(name)
+    
+    @st.cache_data(ttl=300, show_spinner=False)
+    def find_decision_makers_for_focus_area(focus_area):
+        return kg.find_decision_makers_for_focus_area(focus_area)
+    
+    @st.cache_data(ttl=300, show_spinner=False)
+    def get_mydigital_ecosystem():
+        return kg.get_mydigital_ecosystem()
+    
     # Example: Add to search tab
     st.header("Knowledge Graph Search")
     
@@ -474,18 +521,18 @@ def integrate_with_streamlit():
     if query_type == "Find Entity":
         entity_name = st.text_input("Entity Name")
         if st.button("Search"):
-            results = kg.find_entity_by_name(entity_name)
+            results = find_entity_by_name(entity_name)
             st.write(results)
     
     elif query_type == "Find Decision Makers":
         focus_area = st.text_input("Focus Area (e.g., 'AI', 'Digital')")
         if st.button("Search"):
-            results = kg.find_decision_makers_for_focus_area(focus_area)
+            results = find_decision_makers_for_focus_area(focus_area)
             st.dataframe(pd.DataFrame(results))
     
     elif query_type == "Get MyDIGITAL Ecosystem":
         if st.button("Get Ecosystem"):
-            results = kg.get_mydigital_ecosystem()
+            results = get_mydigital_ecosystem()
             st.dataframe(pd.DataFrame(results))
 
 
@@ -503,19 +550,23 @@ def main():
         password="your_password"  # Change this!
     )
     
-    # Create schema
-    kg.create_constraints()
+    # Create schema (secondary indexes are rebuilt after the bulk import)
+    kg.create_uniqueness_constraints()
+    kg.drop_secondary_indexes()
     
     # Load data
-    entities_df = pd.read_csv('data/entities.csv')
-    people_df = pd.read_csv('data/people.csv')
-    partners_df = pd.read_csv('data/partners.csv')
+    entities_df = read_csv_fast('data/entities.csv', ENTITY_DTYPES)
+    people_df = read_csv_fast('data/people.csv', PEOPLE_DTYPES)
+    partners_df = read_csv_fast('data/partners.csv', PARTNER_DTYPES)
     
     # Import data
     kg.import_entities(entities_df)
     kg.import_people(people_df)
     kg.import_partners(partners_df)
     
+    # Build lookup indexes on the populated graph
+    kg.create_secondary_indexes()
+    
     # Get statistics
     stats = kg.get_graph_statistics()
     print("\n" + "="*50)
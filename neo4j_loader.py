@@ -4,6 +4,12 @@ import os
 import pandas as pd
 import logging
 
+from neo4j_common import (
+    BATCH_SIZE, COMMIT_BATCHES, LARGE_IMPORT_ROWS,
+    PROCESSED_ENTITY_DTYPES, PROCESSED_PEOPLE_DTYPES, PROCESSED_PARTNER_DTYPES,
+    read_csv_fast, unwind_query, unwind_in_transactions
+)
+
 # Load environment variables
 load_dotenv()
 
@@ -11,6 +17,7 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
 class Neo4jLoader:
     def __init__(self, uri, user, password):
         self.driver = GraphDatabase.driver(uri, auth=(user, password))
@@ -24,8 +31,8 @@ class Neo4jLoader:
             session.run("MATCH (n) DETACH DELETE n")
             logger.info("Database cleared")
     
-    def create_constraints(self):
-        """Create unique constraints"""
+    def create_uniqueness_constraints(self):
+        """Create unique constraints (required before MERGE-based loading)"""
         constraints = [
             "CREATE CONSTRAINT entity_id IF NOT EXISTS FOR (e:Entity) REQUIRE e.id IS UNIQUE",
             "CREATE CONSTRAINT person_id IF NOT EXISTS FOR (p:Person) REQUIRE p.id IS UNIQUE",
@@ -40,100 +47,143 @@ class Neo4jLoader:
                 except Exception as e:
                     logger.warning(f"Constraint might already exist: {e}")
     
+    def create_secondary_indexes(self):
+        """Create lookup indexes (built once on populated data)"""
+        # Index used by the name-based joins in create_relationships
+        with self.driver.session() as session:
+            session.run("CREATE INDEX entity_name_idx IF NOT EXISTS FOR (e:Entity) ON (e.name)")
+            logger.info("Created index: entity_name_idx")
+            # Indexes populate in the background; wait so the joins don't fall back to label scans
+            session.run("CALL db.awaitIndexes()").consume()
+            logger.info("Indexes online")
+    
+    def drop_secondary_indexes(self):
+        """Drop lookup indexes so bulk loading doesn't maintain them per row"""
+        with self.driver.session() as session:
+            session.run("DROP INDEX entity_name_idx IF EXISTS")
+            logger.info("Dropped index: entity_name_idx")
+    
+    def create_constraints(self):
+        """Create unique constraints and lookup indexes"""
+        self.create_uniqueness_constraints()
+        self.create_secondary_indexes()
+    
+    @staticmethod
+    def _prepare_records(df, string_cols, float_cols=()):
+        """Coerce columns once and return records ready for UNWIND"""
+        prepared = pd.DataFrame(index=df.index)
+        for col in string_cols:
+            prepared[col] = df[col].fillna('').astype(str) if col in df.columns else ''
+        for col in float_cols:
+            prepared[col] = pd.to_numeric(df[col], errors='coerce') if col in df.columns else None
+        prepared = prepared.astype(object).where(pd.notna(prepared), None)
+        return prepared.to_dict('records')
+    
+    @staticmethod
+    def _bulk_write(tx, query, rows, batch_size=BATCH_SIZE):
+        """Run an UNWIND query over rows in batches inside one transaction"""
+        for i in range(0, len(rows), batch_size):
+            tx.run(query, rows=rows[i:i + batch_size])
+    
+    def _write_records(self, body, records):
+        """Write records (`UNWIND $rows AS row` + body) in batches, committing once per group of batches"""
+        if len(records) > LARGE_IMPORT_ROWS:
+            self._write_records_periodic(body, records)
+            return
+        query = unwind_query('rows', 'row', body)
+        group_size = BATCH_SIZE * COMMIT_BATCHES
+        with self.driver.session() as session:
+            for i in range(0, len(records), group_size):
+                session.execute_write(self._bulk_write, query, records[i:i + group_size])
+    
+    def _write_records_periodic(self, body, records):
+        """Write very large record sets with server-side periodic commits"""
+        # IN TRANSACTIONS only runs in auto-commit transactions, i.e. plain session.run
+        periodic_query = unwind_in_transactions('rows', 'row', body)
+        with self.driver.session() as session:
+            for i in range(0, len(records), LARGE_IMPORT_ROWS):
+                session.run(periodic_query, rows=records[i:i + LARGE_IMPORT_ROWS]).consume()
+    
     def load_entities(self, entities_df):
         """Load government entities"""
-        with self.driver.session() as session:
-            for _, row in entities_df.iterrows():
-                query = """
-                MERGE (e:Entity {id: $id})
-                SET e.name = $name,
-                    e.type = $type,
-                    e.category = $category,
-                    e.parent_ministry = $parent_ministry,
-                    e.website = $website,
-                    e.description = $description,
-                    e.location = $location,
-                    e.latitude = $latitude,
-                    e.longitude = $longitude
-                """
-                session.run(query, 
-                    id=str(row.get('id', '')),
-                    name=str(row.get('name', '')),
-                    type=str(row.get('type', '')),
-                    category=str(row.get('category', '')),
-                    parent_ministry=str(row.get('parent_ministry', '')),
-                    website=str(row.get('website', '')),
-                    description=str(row.get('description', '')),
-                    location=str(row.get('location', '')),
-                    latitude=float(row.get('latitude', 0)) if pd.notna(row.get('latitude')) else None,
-                    longitude=float(row.get('longitude', 0)) if pd.notna(row.get('longitude')) else None
-                )
-            logger.info(f"Loaded {len(entities_df)} entities")
+        body = """
+        MERGE (e:Entity {id: row.id})
+        SET e.name = row.name,
+            e.type = row.type,
+            e.category = row.category,
+            e.parent_ministry = row.parent_ministry,
+            e.website = row.website,
+            e.description = row.description,
+            e.location = row.location,
+            e.latitude = row.latitude,
+            e.longitude = row.longitude
+        """
+        records = self._prepare_records(
+            entities_df,
+            ['id', 'name', 'type', 'category', 'parent_ministry',
+             'website', 'description', 'location'],
+            ['latitude', 'longitude']
+        )
+        self._write_records(body, records)
+        logger.info(f"Loaded {len(entities_df)} entities")
     
     def load_people(self, people_df):
         """Load key people"""
-        with self.driver.session() as session:
-            for _, row in people_df.iterrows():
-                query = """
-                MERGE (p:Person {id: $id})
-                SET p.name = $name,
-                    p.position = $position,
-                    p.entity = $entity,
-                    p.email = $email,
-                    p.phone = $phone,
-                    p.background = $background
-                """
-                session.run(query,
-                    id=str(row.get('id', '')),
-                    name=str(row.get('name', '')),
-                    position=str(row.get('position', '')),
-                    entity=str(row.get('entity', '')),
-                    email=str(row.get('email', '')),
-                    phone=str(row.get('phone', '')),
-                    background=str(row.get('background', ''))
-                )
-            logger.info(f"Loaded {len(people_df)} people")
+        body = """
+        MERGE (p:Person {id: row.id})
+        SET p.name = row.name,
+            p.position = row.position,
+            p.entity = row.entity,
+            p.email = row.email,
+            p.phone = row.phone,
+            p.background = row.background
+        """
+        records = self._prepare_records(
+            people_df,
+            ['id', 'name', 'position', 'entity', 'email', 'phone', 'background']
+        )
+        self._write_records(body, records)
+        logger.info(f"Loaded {len(people_df)} people")
     
     def load_partners(self, partners_df):
         """Load private sector partners"""
-        with self.driver.session() as session:
-            for _, row in partners_df.iterrows():
-                query = """
-                MERGE (p:Partner {id: $id})
-                SET p.company_name = $company_name,
-                    p.sector = $sector,
-                    p.govt_entity = $govt_entity,
-                    p.project_name = $project_name,
-                    p.value_rm = $value_rm,
-                    p.start_date = $start_date,
-                    p.status = $status
-                """
-                session.run(query,
-                    id=str(row.get('id', '')),
-                    company_name=str(row.get('company_name', '')),
-                    sector=str(row.get('sector', '')),
-                    govt_entity=str(row.get('govt_entity', '')),
-                    project_name=str(row.get('project_name', '')),
-                    value_rm=float(row.get('value_rm', 0)) if pd.notna(row.get('value_rm')) else None,
-                    start_date=str(row.get('start_date', '')),
-                    status=str(row.get('status', ''))
-                )
-            logger.info(f"Loaded {len(partners_df)} partnerships")
+        body = """
+        MERGE (p:Partner {id: row.id})
+        SET p.company_name = row.company_name,
+            p.sector = row.sector,
+            p.govt_entity = row.govt_entity,
+            p.project_name = row.project_name,
+            p.value_rm = row.value_rm,
+            p.start_date = row.start_date,
+            p.status = row.status
+        """
+        records = self._prepare_records(
+            partners_df,
+            ['id', 'company_name', 'sector', 'govt_entity', 'project_name',
+             'start_date', 'status'],
+            ['value_rm']
+        )
+        self._write_records(body, records)
+        logger.info(f"Loaded {len(partners_df)} partnerships")
     
     def create_relationships(self):
         """Create relationships between entities"""
         with self.driver.session() as session:
             # Person works at Entity
             session.run("""
-                MATCH (p:Person), (e:Entity)
-                WHERE p.entity = e.name
+                MATCH (p:Person)
+                WHERE p.entity IS NOT NULL
+                WITH p
+                MATCH (e:Entity {name: p.entity})
                 MERGE (p)-[:WORKS_AT]->(e)
             """)
             
             # Partner partners with Entity
             session.run("""
-                MATCH (p:Partner), (e:Entity)
-                WHERE p.govt_entity = e.name
+                MATCH (p:Partner)
+                WHERE p.govt_entity IS NOT NULL
+                WITH p
+                MATCH (e:Entity {name: p.govt_entity})
                 MERGE (p)-[:PARTNERS_WITH]->(e)
             """)
             
@@ -155,23 +205,28 @@ def main():
         logger.info("Clearing existing data...")
         loader.clear_database()
         
-        # Create constraints
+        # Create constraints; secondary indexes are rebuilt after loading
         logger.info("Creating constraints...")
-        loader.create_constraints()
+        loader.create_uniqueness_constraints()
+        loader.drop_secondary_indexes()
         
         # Load data
         logger.info("Loading entities...")
-        entities = pd.read_csv('data/processed/entities.csv')
+        entities = read_csv_fast('data/processed/entities.csv', PROCESSED_ENTITY_DTYPES)
         loader.load_entities(entities)
         
         logger.info("Loading people...")
-        people = pd.read_csv('data/processed/people.csv')
+        people = read_csv_fast('data/processed/people.csv', PROCESSED_PEOPLE_DTYPES)
         loader.load_people(people)
         
         logger.info("Loading partners...")
-        partners = pd.read_csv('data/processed/partners.csv')
+        partners = read_csv_fast('data/processed/partners.csv', PROCESSED_PARTNER_DTYPES)
         loader.load_partners(partners)
         
+        # Build indexes on the populated data before the relationship joins
+        logger.info("Creating indexes...")
+        loader.create_secondary_indexes()
+        
         # Create relationships
         logger.info("Creating relationships...")
         loader.create_relationships()
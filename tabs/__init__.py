@@ -1,20 +1,28 @@
 """
 Tabs package for Malaysian Government Digital Ecosystem Dashboard
 Modular 6-tab structure with subtabs
+
+Render functions are resolved lazily (PEP 562) so importing the package
+only pulls in the tab modules that are actually used.
 """
 
-from .tab_overview import render_overview_tab
-from .tab_organizations import render_organizations_tab
-from .tab_stakeholders import render_stakeholders_tab
-from .tab_policy import render_policy_tab
-from .tab_analytics import render_analytics_tab
-from .tab_documentation import render_documentation_tab
+import importlib
+
+_TAB_MODULES = {
+    'render_overview_tab': '.tab_overview',
+    'render_organizations_tab': '.tab_organizations',
+    'render_stakeholders_tab': '.tab_stakeholders',
+    'render_policy_tab': '.tab_policy',
+    'render_analytics_tab': '.tab_analytics',
+    'render_documentation_tab': '.tab_documentation'
+}
+
+
+def __getattr__(name):
+    if name in _TAB_MODULES:
+        module = importlib.import_module(_TAB_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = [
-    'render_overview_tab',
-    'render_organizations_tab',
-    'render_stakeholders_tab',
-    'render_policy_tab',
-    'render_analytics_tab',
-    'render_documentation_tab'
-]
\ No newline at end of file
+__all__ = list(_TAB_MODULES)
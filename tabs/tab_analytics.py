@@ -3,12 +3,51 @@ TAB 5: Analytics
 Procurement Analysis and Knowledge Graph
 """
 
+import atexit
+import io
+import os
+from collections import Counter
+from types import MappingProxyType
+
 import streamlit as st
 import pandas as pd
+import numpy as np
+import networkx as nx
 import plotly.express as px
 import plotly.graph_objects as go
+from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode
 from neo4j_connector import Neo4jConnector
 
+# Rows handed to the directory grid per "Load more" step
+DIRECTORY_PAGE_ROWS = 2000
+
+# Node labels offered by the Knowledge Graph filter
+NODE_TYPE_LABELS = ["Entity", "Department", "Agency", "Company", "Partner", "Initiative", "Policy", "People"]
+
+# Node colors shared by the donut chart, network graph and legend
+NODE_COLOR_MAP = MappingProxyType({
+    'Person': '#FFE66D',
+    'People': '#FFE66D',
+    'Organization': '#4ECDC4',
+    'Ministry': '#FF9FF3',
+    'Entity': '#FF6B6B',
+    'Partner': '#95E1D3',
+    'Company': '#38B6FF',
+    'Policy': '#5F27CD',
+    'Department': '#EFAA7C',
+    'Agency': '#FFD93D',
+    'Initiative': '#6BCF7F'
+})
+
+# Canonical short names for entities, applied once when the CSV is loaded
+ENTITY_ALIASES = {
+    'MyDIGITAL Corporation': 'MyDIGITAL',
+    'Ministry of Digital': 'MOD',
+    'Malaysian Communications and Multimedia Commission': 'MCMC',
+    'Malaysia Digital Economy Corporation': 'MDEC',
+    'Ministry of Higher Education': 'MOHE'
+}
+
 
 def render_analytics_tab(entities_df, people_df, partners_df, has_csv_data, research_data):
     """Render Analytics with 2 subtabs"""
@@ -16,13 +55,7 @@ def render_analytics_tab(entities_df, people_df, partners_df, has_csv_data, rese
     st.markdown('<h4 style="text-align: center;">Procurement Insights and Network Graph</h4>', unsafe_allow_html=True)
     st.markdown("---")
 
-    # Load procurement data directly from CSV
-    def load_csv(path: str) -> pd.DataFrame:
-        try:
-            return pd.read_csv(path, dtype=str, encoding="utf-8", engine="python")
-        except Exception:
-            return pd.DataFrame()
-
+    # Load procurement data directly from CSV (cached across reruns)
     procurement_df = load_csv("data/procurement_analysis.csv")
 
     # Create subtabs
@@ -43,20 +76,62 @@ def render_analytics_tab(entities_df, people_df, partners_df, has_csv_data, rese
         render_knowledge_graph()
 
 
-def standardize_entity_names(df):
-    """Standardize entity names across datasets"""
+@st.cache_data(show_spinner=False)
+def _load_csv_cached(path: str, mtime: float) -> pd.DataFrame:
+    """Parse a CSV once per file modification and precompute derived columns"""
+    df = pd.read_csv(path, dtype=str, encoding="utf-8")
     if 'entity' in df.columns:
-        df = df.copy()
-        df['entity'] = df['entity'].replace({
-            'MyDIGITAL Corporation': 'MyDIGITAL',
-            'Ministry of Digital': 'MOD',
-            'Malaysian Communications and Multimedia Commission': 'MCMC',
-            'Malaysia Digital Economy Corporation': 'MDEC',
-            'Ministry of Higher Education': 'MOHE'
-        })
+        # Categorical so entity filters and counts work on integer codes
+        df['entity'] = df['entity'].replace(ENTITY_ALIASES).astype('category')
+    if 'confidence_score' in df.columns:
+        df['confidence_score_num'] = pd.to_numeric(
+            df['confidence_score'].astype(str).str.rstrip('%'),
+            errors='coerce'
+        ).astype('float32')
+    if 'status' in df.columns:
+        df['is_active'] = df['status'].fillna('').str.upper().str.contains('ACTIVE', regex=False)
     return df
 
 
+def load_csv(path: str) -> pd.DataFrame:
+    """Load a CSV through the cache, keyed on path and modification time"""
+    try:
+        return _load_csv_cached(path, os.path.getmtime(path))
+    except Exception:
+        return pd.DataFrame()
+
+
+def _summarize_procurement(df):
+    """Summary metrics and category counts for one slice of procurement data"""
+    has_category = 'procurement_category' in df.columns
+    return {
+        'total': len(df),
+        'categories': df['procurement_category'].nunique() if has_category else 0,
+        'active': int(df['is_active'].sum()) if 'is_active' in df.columns else 0,
+        'avg_conf': df['confidence_score_num'].mean() if 'confidence_score_num' in df.columns else 0,
+        'cat_counts': df['procurement_category'].value_counts() if has_category else pd.Series(dtype=int)
+    }
+
+
+@st.cache_data(show_spinner=False)
+def build_procurement_index(df):
+    """Precompute per-entity summaries once so filter changes are dict lookups"""
+    index = {"All Entities": _summarize_procurement(df)}
+    if 'entity' in df.columns:
+        index["All Entities"]['entity_counts'] = df['entity'].value_counts()
+        for entity, group in df.groupby('entity', sort=False, observed=True):
+            index[entity] = _summarize_procurement(group)
+    return index
+
+
+def top_n_with_other(counts, n=20):
+    """Keep the n largest counts and fold the remainder into an 'Other' bucket"""
+    if len(counts) <= n:
+        return counts
+    top = counts.nlargest(n)
+    return pd.concat([top, pd.Series({'Other': counts.drop(top.index).sum()})])
+
+
 def render_procurement_analysis(procurement_df):
     """Render procurement analysis with entity filtering"""
 
@@ -64,11 +139,8 @@ def render_procurement_analysis(procurement_df):
         st.warning("No procurement data found")
         return
 
-    # Standardize entity names
-    procurement_df = standardize_entity_names(procurement_df)
-
     # Entity filter
-    entities = ["All Entities"] + sorted(procurement_df['entity'].unique().tolist())
+    entities = ["All Entities"] + sorted(procurement_df['entity'].cat.categories)
     selected_entity = st.selectbox(
         "Filter by Entity:",
         entities,
@@ -85,24 +157,12 @@ def render_procurement_analysis(procurement_df):
 
     st.markdown(f"<h4 style='text-align: center;'>{display_title}</h4>", unsafe_allow_html=True)
 
-    # Summary Metrics 
-    # Calculate metrics
-    total_items = len(filtered_df)
-
-    categories = 0
-    if 'procurement_category' in filtered_df.columns:
-        categories = filtered_df['procurement_category'].nunique()
-
-    active_contracts = 0
-    if 'status' in filtered_df.columns:
-        active_contracts = len(filtered_df[filtered_df['status'].str.contains('ACTIVE', case=False, na=False)])
-
-    avg_confidence = 0
-    if 'confidence_score' in filtered_df.columns:
-        avg_confidence = pd.to_numeric(
-            filtered_df['confidence_score'].astype(str).str.replace('%', ''),
-            errors='coerce'
-        ).mean()
+    # Summary Metrics (precomputed per entity)
+    summary = build_procurement_index(procurement_df)[selected_entity]
+    total_items = summary['total']
+    categories = summary['categories']
+    active_contracts = summary['active']
+    avg_confidence = summary['avg_conf']
 
     # Display metrics with custom HTML
     st.markdown(f"""
@@ -145,12 +205,25 @@ def render_procurement_analysis(procurement_df):
     }
     display_df = display_df.rename(columns={k: v for k, v in column_rename.items() if k in display_df.columns})
 
-    st.dataframe(
-        display_df,
-        use_container_width=True,
-        hide_index=True,
+    # Paginated grid with a stable key so AgGrid can reuse its row data across reruns
+    gb = GridOptionsBuilder.from_dataframe(display_df)
+    gb.configure_pagination(paginationAutoPageSize=False, paginationPageSize=50)
+    gb.configure_default_column(filter=True, sortable=True)
+    # Large result sets are handed to the grid a page at a time
+    rows_key = f"proc_rows_{selected_entity}"
+    shown_rows = st.session_state.get(rows_key, DIRECTORY_PAGE_ROWS)
+    AgGrid(
+        display_df.head(shown_rows),
+        gridOptions=gb.build(),
+        update_mode=GridUpdateMode.NO_UPDATE,
+        key=f"proc_grid_{selected_entity}",
         height=400
     )
+    if len(display_df) > shown_rows:
+        st.caption(f"Showing {shown_rows} of {len(display_df)} rows")
+        if st.button("Load more", key=f"proc_load_more_{selected_entity}"):
+            st.session_state[rows_key] = shown_rows + DIRECTORY_PAGE_ROWS
+            st.rerun()
 
     st.markdown("---")
 
@@ -162,120 +235,173 @@ def render_procurement_analysis(procurement_df):
         if 'procurement_category' in filtered_df.columns and len(filtered_df) > 0:
             st.markdown("<h4 style='text-align: center;'>Procurement by Category</h4>", unsafe_allow_html=True)
 
-            category_counts = filtered_df['procurement_category'].value_counts().reset_index()
+            category_counts = top_n_with_other(summary['cat_counts']).reset_index()
             category_counts.columns = ['Category', 'Count']
             category_counts['Count'] = category_counts['Count'].astype(int)
             category_counts = category_counts.sort_values('Count', ascending=True)
+            fig_dict = build_category_fig(tuple(category_counts.itertuples(index=False, name=None)))
 
-            fig = go.Figure(data=[go.Bar(
-                x=category_counts['Count'].tolist(),
-                y=category_counts['Category'].tolist(),
-                orientation='h',
-                marker_color='#2196f3',
-                text=category_counts['Count'].tolist(),
-                textposition='outside',
-                textfont=dict(size=14)
-            )])
-
-            fig.update_layout(
-                height=400,
-                margin=dict(l=20, r=20, t=40, b=40),
-                xaxis_title='Number of Procurements',
-                yaxis_title='',
-                showlegend=False,
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                xaxis=dict(
-                    gridcolor='#e0e0e0',
-                    range=[0, max(category_counts['Count']) * 1.15]
-                ),
-                yaxis=dict(
-                    tickfont=dict(size=10)
-                )
-            )
-
-            st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+            st.plotly_chart(fig_dict, use_container_width=True, config={"displayModeBar": False})
 
     with col2:
         # Procurement by Entity (if showing all entities)
         if selected_entity == "All Entities" and 'entity' in filtered_df.columns and len(filtered_df) > 0:
             st.markdown("<h4 style='text-align: center;'>Procurement by Entity</h4>", unsafe_allow_html=True)
 
-            entity_counts = filtered_df['entity'].value_counts().reset_index()
+            entity_counts = top_n_with_other(summary['entity_counts']).reset_index()
             entity_counts.columns = ['Entity', 'Count']
             entity_counts['Count'] = entity_counts['Count'].astype(int)
             entity_counts = entity_counts.sort_values('Count', ascending=False)
-
-            colors = ['#8B5CF6', '#EC4899', '#F59E0B', '#10B981', '#3B82F6']
-
-            fig = go.Figure(data=[go.Bar(
-                x=entity_counts['Entity'].tolist(),
-                y=entity_counts['Count'].tolist(),
-                marker_color=colors[:len(entity_counts)],
-                text=entity_counts['Count'].tolist(),
-                textposition='outside',
-                textfont=dict(size=14)
-            )])
-
-            fig.update_layout(
-                height=400,
-                margin=dict(l=20, r=20, t=40, b=40),
-                xaxis_title='Entity',
-                yaxis_title='Number of Procurements',
-                showlegend=False,
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                yaxis=dict(
-                    gridcolor='#e0e0e0',
-                    range=[0, max(entity_counts['Count']) * 1.15]
-                )
-            )
-
-            st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+            fig_dict = build_entity_fig(tuple(entity_counts.itertuples(index=False, name=None)))
+
+            st.plotly_chart(fig_dict, use_container_width=True, config={"displayModeBar": False})
+
+
+@st.cache_data(show_spinner=False)
+def build_category_fig(category_counts):
+    """Category bar chart as a plain figure dict, cached per (category, count) tuple"""
+    cats_arr = np.array([str(c) for c, _ in category_counts], dtype=object)
+    counts_arr = np.array([n for _, n in category_counts])
+
+    fig = go.Figure(data=[go.Bar(
+        x=counts_arr,
+        y=cats_arr,
+        orientation='h',
+        marker_color='#2196f3',
+        text=counts_arr,
+        textposition='outside',
+        textfont=dict(size=14)
+    )])
+
+    fig.update_layout(
+        height=400,
+        margin=dict(l=20, r=20, t=40, b=40),
+        xaxis_title='Number of Procurements',
+        yaxis_title='',
+        showlegend=False,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis=dict(
+            gridcolor='#e0e0e0',
+            range=[0, counts_arr.max() * 1.15]
+        ),
+        yaxis=dict(
+            tickfont=dict(size=10)
+        )
+    )
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def build_entity_fig(entity_counts):
+    """Entity bar chart as a plain figure dict, cached per (entity, count) tuple"""
+    entity_arr = np.array([str(e) for e, _ in entity_counts], dtype=object)
+    entity_counts_arr = np.array([n for _, n in entity_counts])
+
+    colors = ['#8B5CF6', '#EC4899', '#F59E0B', '#10B981', '#3B82F6']
+
+    fig = go.Figure(data=[go.Bar(
+        x=entity_arr,
+        y=entity_counts_arr,
+        marker_color=colors[:len(entity_counts)],
+        text=entity_counts_arr,
+        textposition='outside',
+        textfont=dict(size=14)
+    )])
+
+    fig.update_layout(
+        height=400,
+        margin=dict(l=20, r=20, t=40, b=40),
+        xaxis_title='Entity',
+        yaxis_title='Number of Procurements',
+        showlegend=False,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        yaxis=dict(
+            gridcolor='#e0e0e0',
+            range=[0, entity_counts_arr.max() * 1.15]
+        )
+    )
+    return fig.to_dict()
 
 # ============================================================================
 # Knowledge Graph
 # ============================================================================
 
+@st.cache_resource(show_spinner=False)
+def get_connector():
+    """Return the Neo4jConnector shared by every session, creating it on first use"""
+    connector = Neo4jConnector()
+    # One driver for the whole process, so one cleanup hook closes its pool on exit
+    atexit.register(connector.close)
+    return connector
+
+
+@st.cache_data(ttl=300, show_spinner="Loading graph...")
+def fetch_graph(limit, filter_labels=None):
+    """Fetch nodes and relationships from Neo4j, cached per (limit, labels) key"""
+    return get_connector().get_full_graph_data(
+        limit=limit,
+        filter_labels=list(filter_labels) if filter_labels else None
+    )
+
+
+@st.cache_data(show_spinner=False)
+def compute_layout(nodes_tuple, edges_tuple):
+    """Compute node positions once per distinct node/edge set.
+
+    Uses igraph's native Fruchterman-Reingold layout when python-igraph is
+    installed and falls back to NetworkX's spring layout otherwise.
+    """
+    try:
+        import igraph as ig
+    except ImportError:
+        G = nx.Graph()
+        G.add_nodes_from(nodes_tuple)
+        G.add_edges_from(edges_tuple)
+        return {n: tuple(xy) for n, xy in nx.spring_layout(G, k=0.5, iterations=50).items()}
+
+    index = {n: i for i, n in enumerate(nodes_tuple)}
+    graph = ig.Graph(n=len(nodes_tuple), edges=[(index[u], index[v]) for u, v in edges_tuple])
+    coords = graph.layout_fruchterman_reingold(niter=50).coords
+    return {n: tuple(coords[i]) for n, i in index.items()}
+
+
+def csv_bytes(df, chunk_size=10_000):
+    """Encode a DataFrame to CSV bytes in row chunks instead of one large string"""
+    buffer = io.BytesIO()
+    buffer.write(df.head(0).to_csv(index=False).encode("utf-8"))
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+        buffer.write(chunk.to_csv(index=False, header=False).encode("utf-8"))
+    return buffer.getvalue()
+
+
+def node_degrees(G):
+    """Return (node ids, degree array) computed from a CSR adjacency matrix"""
+    node_ids = list(G.nodes())
+    if not node_ids:
+        return node_ids, np.zeros(0, dtype=np.int64)
+    adjacency = nx.to_scipy_sparse_array(G, nodelist=node_ids, weight=None, format='csr')
+    return node_ids, np.asarray(adjacency.sum(axis=1)).ravel()
+
+
 def render_knowledge_graph():
     """Render Interactive Knowledge Graph from Neo4j Aura with advanced features"""
 
     st.markdown("<h4 style='text-align: center;'>Knowledge Graph Network</h4>", unsafe_allow_html=True)
 
     try:
-        connector = Neo4jConnector()
+        connector = get_connector()
 
         # Filters Section
         st.markdown("### Filters")
-        filter_cols = st.columns(8)
-
-        with filter_cols[0]:
-            filter_entity = st.checkbox("Entity", value=True)
-        with filter_cols[1]:
-            filter_department = st.checkbox("Department", value=True)
-        with filter_cols[2]:
-            filter_agency = st.checkbox("Agency", value=True)
-        with filter_cols[3]:
-            filter_company = st.checkbox("Company", value=True)
-        with filter_cols[4]:
-            filter_partner = st.checkbox("Partner", value=True)
-        with filter_cols[5]:
-            filter_initiative = st.checkbox("Initiative", value=True)
-        with filter_cols[6]:
-            filter_policy = st.checkbox("Policy", value=True)
-        with filter_cols[7]:
-            filter_people = st.checkbox("People", value=True)
-
-        # Build filter query based on selections
-        filter_labels = []
-        if filter_entity: filter_labels.append("Entity")
-        if filter_department: filter_labels.append("Department")
-        if filter_agency: filter_labels.append("Agency")
-        if filter_company: filter_labels.append("Company")
-        if filter_partner: filter_labels.append("Partner")
-        if filter_initiative: filter_labels.append("Initiative")
-        if filter_policy: filter_labels.append("Policy")
-        if filter_people: filter_labels.append("People")
+        filter_labels = st.multiselect(
+            "Node types",
+            NODE_TYPE_LABELS,
+            default=NODE_TYPE_LABELS,
+            key="kg_labels"
+        )
 
         st.markdown("---")
 
@@ -341,48 +467,54 @@ def render_knowledge_graph():
         st.markdown("---")
 
         # Retrieve graph data with filters applied
-        import networkx as nx
-        nodes, relationships = connector.get_full_graph_data(limit=limit, filter_labels=filter_labels if filter_labels else None)
+        nodes, relationships = fetch_graph(int(limit), tuple(sorted(filter_labels)) if filter_labels else None)
 
-        # Calculate statistics from actual retrieved data
+        # Build the graph once; it is reused for degree stats and the network plot
+        G = nx.Graph()
+        if nodes and relationships:
+            G.add_nodes_from(
+                (node['id'], {'label': node['label'], 'name': node.get('name', 'Unknown')})
+                for node in nodes
+            )
+            G.add_edges_from(
+                (rel['source'], rel['target'], {'relationship': rel['relationship']})
+                for rel in relationships
+            )
+
+        # Degrees from the sparse adjacency matrix; zero-degree nodes are the
+        # isolates, dropped up front so stats, layout and traces only process
+        # what the network graph actually renders
+        node_ids, degrees = node_degrees(G)
+        connected = degrees > 0
+        G.remove_nodes_from([n for n, keep in zip(node_ids, connected) if not keep])
+        node_ids = [n for n, keep in zip(node_ids, connected) if keep]
+        degrees = degrees[connected]
+        nodes = [n for n in nodes if n['id'] in G]
+        nodes_by_id = {n['id']: n for n in nodes}
+
+        # Calculate statistics from the rendered graph data
         stats = {
             'total_nodes': len(nodes),
             'total_relationships': len(relationships),
-            'node_types': {},
-            'relationship_types': {},
+            'node_types': dict(Counter(n.get('label', 'Unknown') for n in nodes)),
+            'relationship_types': dict(Counter(r.get('relationship', 'Unknown') for r in relationships)),
             'most_connected': []
         }
 
-        # Count node types from retrieved nodes
-        for node in nodes:
-            node_type = node.get('label', 'Unknown')
-            stats['node_types'][node_type] = stats['node_types'].get(node_type, 0) + 1
-
-        # Count relationship types from retrieved relationships
-        for rel in relationships:
-            rel_type = rel.get('relationship', 'Unknown')
-            stats['relationship_types'][rel_type] = stats['relationship_types'].get(rel_type, 0) + 1
-
-        # Calculate most connected nodes
         if nodes and relationships:
-            G = nx.Graph()
-            for node in nodes:
-                G.add_node(node['id'], label=node['label'], name=node.get('name', 'Unknown'))
-            for rel in relationships:
-                G.add_edge(rel['source'], rel['target'])
-
             # Calculate degree (connections) for each node
-            node_degrees = dict(G.degree())
             most_connected_list = []
-            for node_id, degree in sorted(node_degrees.items(), key=lambda x: x[1], reverse=True)[:10]:
-                if degree > 0:  # Only include connected nodes
-                    node_data = next((n for n in nodes if n['id'] == node_id), None)
-                    if node_data:
-                        most_connected_list.append({
-                            'name': node_data.get('name', 'Unknown'),
-                            'type': node_data.get('label', 'Unknown'),
-                            'connections': degree
-                        })
+            top_k = min(10, len(degrees))
+            top_idx = np.argpartition(-degrees, top_k - 1)[:top_k]
+            top_idx = top_idx[np.argsort(-degrees[top_idx], kind='stable')]
+            for i in top_idx:
+                node_data = nodes_by_id.get(node_ids[i])
+                if node_data:
+                    most_connected_list.append({
+                        'name': node_data.get('name', 'Unknown'),
+                        'type': node_data.get('label', 'Unknown'),
+                        'connections': int(degrees[i])
+                    })
             stats['most_connected'] = most_connected_list
 
         # Network Statistics - Horizontal layout
@@ -447,22 +579,9 @@ def render_knowledge_graph():
             st.markdown("<h4 style='text-align: center;'>Node Type Distribution</h4>", unsafe_allow_html=True)
             if stats['node_types']:
                 # Donut chart for node types with color mapping
-                color_map = {
-                    'People': '#FFE66D',
-                    'Organization': '#4ECDC4',
-                    'Ministry': '#FF9FF3',
-                    'Entity': '#FF6B6B',
-                    'Partner': '#95E1D3',
-                    'Company': '#38B6FF',
-                    'Policy': '#5F27CD',
-                    'Department': '#00C9A7',
-                    'Agency': '#FFB53D',
-                    'Initiative': '#6BCF7F'
-                }
-
                 node_types = list(stats['node_types'].keys())
                 node_counts = list(stats['node_types'].values())
-                colors = [color_map.get(node_type, '#95E1D3') for node_type in node_types]
+                colors = [NODE_COLOR_MAP.get(node_type, '#95E1D3') for node_type in node_types]
 
                 fig = go.Figure(data=[go.Pie(
                     labels=node_types,
@@ -494,69 +613,51 @@ def render_knowledge_graph():
         st.markdown("<h4 style='text-align: center;'>Network Graph</h4>", unsafe_allow_html=True)
 
         # Reuse the graph G that was already created
-        if nodes and relationships:
-            # Re-create G with relationships for visualization (earlier G was just for degree calculation)
-            G_viz = nx.Graph()
-            for node in nodes:
-                G_viz.add_node(node['id'], label=node['label'], name=node.get('name', 'Unknown'))
-            for rel in relationships:
-                G_viz.add_edge(rel['source'], rel['target'], relationship=rel['relationship'])
-
-            # Remove disconnected nodes (isolates)
-            isolates = list(nx.isolates(G_viz))
-            G_viz.remove_nodes_from(isolates)
-
+        if relationships:
             # Only proceed if graph has nodes after removing isolates
-            if len(G_viz.nodes()) == 0:
+            if len(G.nodes()) == 0:
                 st.info("No connected nodes found in the graph")
             else:
                 # Create layout
-                pos = nx.spring_layout(G_viz, k=0.5, iterations=50)
-
-                # Create edge traces
-                edge_traces = []
-                for edge in G_viz.edges():
-                    x0, y0 = pos[edge[0]]
-                    x1, y1 = pos[edge[1]]
-
-                    edge_trace = go.Scatter(
-                        x=[x0, x1, None],
-                        y=[y0, y1, None],
-                        mode='lines',
-                        line=dict(width=1, color='#888'),
-                        hoverinfo='none',
-                        showlegend=False
-                    )
-                    edge_traces.append(edge_trace)
+                pos = compute_layout(
+                    tuple(sorted(G.nodes())),
+                    tuple(sorted(tuple(sorted(edge)) for edge in G.edges()))
+                )
+
+                # Create a single WebGL edge trace (segments separated by None)
+                edge_x = []
+                edge_y = []
+                for u, v in G.edges():
+                    x0, y0 = pos[u]
+                    x1, y1 = pos[v]
+                    edge_x += [x0, x1, None]
+                    edge_y += [y0, y1, None]
+
+                edge_trace = go.Scattergl(
+                    x=edge_x,
+                    y=edge_y,
+                    mode='lines',
+                    line=dict(width=1, color='#888'),
+                    hoverinfo='none',
+                    showlegend=False
+                )
 
                 # Create node trace
-                node_x = []
-                node_y = []
-                node_text = []
-                node_colors = []
-
-                color_map = {
-                    'Person': '#FFE66D',
-                    'Organization': '#4ECDC4',
-                    'Ministry': '#FF9FF3',
-                    'Entity': '#FF6B6B',
-                    'Partner': '#95E1D3',
-                    'Company': '#38B6FF',
-                    'Policy': '#5F27CD',
-                    'Department': '#EFAA7C',
-                    'Agency': '#FFD93D',
-                    'Initiative': '#6BCF7F'
-                }
-
-                for node in G_viz.nodes():
-                    x, y = pos[node]
-                    node_x.append(x)
-                    node_y.append(y)
-                    node_data = G_viz.nodes[node]
-                    node_text.append(f"{node_data.get('name', 'Unknown')}<br>Type: {node_data.get('label', 'Unknown')}")
-                    node_colors.append(color_map.get(node_data.get('label', ''), '#95E1D3'))
-
-                node_trace = go.Scatter(
+
+                # Build the per-node arrays from a single pass over the node data
+                nodes_list = list(G.nodes(data=True))
+                node_count = len(nodes_list)
+                node_x = np.fromiter((pos[n][0] for n, _ in nodes_list), dtype=np.float32, count=node_count)
+                node_y = np.fromiter((pos[n][1] for n, _ in nodes_list), dtype=np.float32, count=node_count)
+                node_labels = [d.get('label', '') for _, d in nodes_list]
+                node_names_short = [(d.get('name') or '')[:15] for _, d in nodes_list]
+                node_colors = np.array([NODE_COLOR_MAP.get(label, '#95E1D3') for label in node_labels])
+                node_text = np.array([
+                    f"{d.get('name', 'Unknown')}<br>Type: {d.get('label', 'Unknown')}"
+                    for _, d in nodes_list
+                ])
+
+                node_trace = go.Scattergl(
                     x=node_x,
                     y=node_y,
                     mode='markers+text',
@@ -565,7 +666,7 @@ def render_knowledge_graph():
                         color=node_colors,
                         line=dict(width=2, color='white')
                     ),
-                    text=[G.nodes[node].get('name', '')[:15] for node in G.nodes()],
+                    text=node_names_short,
                     textposition='top center',
                     textfont=dict(size=8),
                     hovertext=node_text,
@@ -574,7 +675,7 @@ def render_knowledge_graph():
                 )
 
                 # Create figure
-                fig = go.Figure(data=edge_traces + [node_trace])
+                fig = go.Figure(data=[edge_trace, node_trace])
 
                 fig.update_layout(
                     height=700,
@@ -595,19 +696,6 @@ def render_knowledge_graph():
         # Legend - Color-coded node types
         st.markdown("<h4 style='text-align: center;'>Legend: Node Types</h4>", unsafe_allow_html=True)
 
-        color_map = {
-            'Person': '#FFE66D',
-            'Organization': '#4ECDC4',
-            'Ministry': '#FF9FF3',
-            'Entity': '#FF6B6B',
-            'Partner': '#95E1D3',
-            'Company': '#38B6FF',
-            'Policy': '#5F27CD',
-            'Department': '#EFAA7C',
-            'Agency': '#FFD93D',
-            'Initiative': '#6BCF7F'
-        }
-
         # Create legend in a single row
         legend_items = list(stats['node_types'].items())
         num_items = len(legend_items)
@@ -615,7 +703,7 @@ def render_knowledge_graph():
         if num_items > 0:
             cols = st.columns(num_items)
             for col_idx, (node_type, count) in enumerate(legend_items):
-                color = color_map.get(node_type, '#95E1D3')
+                color = NODE_COLOR_MAP.get(node_type, '#95E1D3')
                 with cols[col_idx]:
                     st.markdown(f"""
                     <div style="text-align: center; padding: 10px; background: white; border-radius: 5px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
@@ -636,7 +724,7 @@ def render_knowledge_graph():
             if st.button("Export Nodes (CSV)", use_container_width=True):
                 try:
                     nodes_df = connector.export_nodes_to_df()
-                    csv = nodes_df.to_csv(index=False)
+                    csv = csv_bytes(nodes_df)
                     st.download_button(
                         "Download Nodes CSV",
                         csv,
@@ -651,7 +739,7 @@ def render_knowledge_graph():
             if st.button("Export Relationships (CSV)", use_container_width=True):
                 try:
                     rels_df = connector.export_relationships_to_df()
-                    csv = rels_df.to_csv(index=False)
+                    csv = csv_bytes(rels_df)
                     st.download_button(
                         "Download Relationships CSV",
                         csv,
@@ -662,8 +750,6 @@ def render_knowledge_graph():
                 except Exception as e:
                     st.error(f"Error exporting relationships: {e}")
 
-        connector.close()
-
     except Exception as e:
         st.error(f"Error connecting to Neo4j: {e}")
         st.info("""
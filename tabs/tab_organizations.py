@@ -7,51 +7,49 @@ import streamlit as st
 import pandas as pd
 import streamlit_mermaid as stmd
 
+from utils.styles import section_header
 
-def render_organizations_tab(entities_df, people_df, partners_df, has_csv_data, nodes_raw, relationships_raw):
-    """Render the Organization Structure tab with subtabs for each organization"""
-    
-    st.markdown('<h3 style="text-align: center;">Organizational Structure</h3>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-    st.markdown("---")
-    
-    # Create subtabs for each organization
-    org_tabs = st.tabs([
-        "MOHE", 
-        "MCMC", 
-        "Ministry of Digital", 
-        "MyDIGITAL Corp", 
-        "MDEC"
-    ])
-    
-    # ============================================================================
-    # SUBTAB 1: MINISTRY OF HIGHER EDUCATION (MOHE)
-    # ============================================================================
-    with org_tabs[0]:
-        st.markdown('<h3 style="text-align: center;">Ministry of Higher Education (MOHE)</h3>', unsafe_allow_html=True)
-        st.markdown("---")
-        
-        # Quick Facts - Using Streamlit columns instead of HTML
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown('<div style="text-align: center;"><strong>Established</strong><br>March 27, 2004</div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown('<div style="text-align: center;"><strong>Budget 2025</strong><br>RM18.09B</div>', unsafe_allow_html=True)
-        with col3:
-            st.markdown('<div style="text-align: center;"><strong>Public Universities</strong><br>20</div>', unsafe_allow_html=True)
-        with col4:
-            st.markdown('<div style="text-align: center;"><strong>Students</strong><br>1.2M+</div>', unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Organizational Hierarchy
-        
-        st.markdown('<h4 style="text-align: center;">Organizational Structure</h4>', unsafe_allow_html=True)
-        st.markdown("---")
-        
-         # Dot Diagram
-         
-        mohe_dot = """
+
+_QF_CELL = '<div style="text-align: center;"><strong>{}</strong><br>{}</div>'
+_QF_GRID = '<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">{}</div>'
+
+
+def _quick_facts_html(facts):
+    """(label, value) facts as a four-column CSS grid"""
+    return _QF_GRID.format("".join(_QF_CELL.format(label, value) for label, value in facts))
+
+
+@st.cache_data(show_spinner=False)
+def _dot_svg(dot):
+    """Lay out a DOT diagram once on the server; None if Graphviz is unavailable"""
+    try:
+        import graphviz
+    except ImportError:
+        return None
+    try:
+        return graphviz.Source(dot).pipe(format="svg").decode("utf-8")
+    except graphviz.ExecutableNotFound:
+        return None
+
+
+def _render_dot(dot):
+    """Show a DOT diagram as pre-rendered SVG, or lay it out in the browser as a fallback"""
+    svg = _dot_svg(dot)
+    if svg is None:
+        st.graphviz_chart(dot, use_container_width=True)
+    else:
+        st.html(f'<div style="text-align: center; overflow-x: auto;">{svg}</div>')
+
+
+def _render_quick_facts(facts):
+    """Render (label, value) facts side by side as one markdown element"""
+    st.markdown(_quick_facts_html(facts), unsafe_allow_html=True)
+
+
+# ============================================================================
+# SUBTAB 1: MINISTRY OF HIGHER EDUCATION (MOHE)
+# ============================================================================
+_MOHE_DOT = """
 digraph {
     rankdir=TB;
     node [shape=box, style=filled, fillcolor=lightyellow];
@@ -69,49 +67,44 @@ digraph {
     "Agencies" -> {"MQA" "PTPTN" "National Professors Council" "Malaysian Citation Centre"};
 }
 """
-        st.graphviz_chart(mohe_dot, use_container_width=True)
-
-        st.markdown("---")
-        st.markdown('<h4 style="text-align: left;">Breakdown Table</h4>', unsafe_allow_html=True)
-        
-        # Breakdown Table
-        breakdown_data = pd.DataFrame({
-            'Type': ['Departments', 'Public Universities', 'Polytechnics', 'Community Colleges', 'Agencies'],
-            'Count': [5, 20, 36, 103, 4],
-            'Oversight': ['Direct', 'Autonomous', 'Centralized', 'Centralized', 'Regulatory']
-        })
-        st.dataframe(breakdown_data, use_container_width=True, hide_index=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    # ============================================================================
-    # SUBTAB 2: MCMC
-    # ============================================================================
-    with org_tabs[1]:
-        st.markdown('<h3 style="text-align: center;">Malaysian Communications and Multimedia Commission (MCMC)</h3>', unsafe_allow_html=True)
-        st.markdown("---")
-        
-        # Quick Facts - Using Streamlit columns
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown('<div style="text-align: center;"><strong>Established</strong><br>November 1, 1998</div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown('<div style="text-align: center;"><strong>5G Coverage</strong><br>82.4%</div>', unsafe_allow_html=True)
-        with col3:
-            st.markdown('<div style="text-align: center;"><strong>New Towers (JENDELA)</strong><br>382+</div>', unsafe_allow_html=True)
-        with col4:
-            st.markdown('<div style="text-align: center;"><strong>Active Licenses</strong><br>Multiple Telcos</div>', unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Organizational Hierarchy
-        
-        st.markdown('<h4 style="text-align: center;">Organizational Structure</h4>', unsafe_allow_html=True)
-        st.markdown("---")
-        
-        # Dot Diagram
-        
-        mcmc_dot = """
+
+_MOHE_BREAKDOWN = pd.DataFrame({
+    'Type': ('Departments', 'Public Universities', 'Polytechnics', 'Community Colleges', 'Agencies'),
+    'Count': (5, 20, 36, 103, 4),
+    'Oversight': ('Direct', 'Autonomous', 'Centralized', 'Centralized', 'Regulatory')
+}).set_index('Type')
+
+
+def _render_mohe():
+    """Render the Ministry of Higher Education (MOHE) subtab"""
+    st.markdown('<h3 style="text-align: center;">Ministry of Higher Education (MOHE)</h3>\n\n---', unsafe_allow_html=True)
+    
+    # Quick Facts
+    _render_quick_facts((
+        ('Established', 'March 27, 2004'),
+        ('Budget 2025', 'RM18.09B'),
+        ('Public Universities', '20'),
+        ('Students', '1.2M+')
+    ))
+    
+    # Organizational Hierarchy
+    section_header("Organizational Structure", align="center")
+    st.divider()
+    
+    # Dot Diagram
+
+    _render_dot(_MOHE_DOT)
+
+    section_header("Breakdown Table")
+    
+    # Breakdown Table
+    st.table(_MOHE_BREAKDOWN)
+
+
+# ============================================================================
+# SUBTAB 2: MCMC
+# ============================================================================
+_MCMC_DOT = """
 digraph {
     rankdir=TB;
     node [shape=box, style=filled, fillcolor=lightcyan];
@@ -124,49 +117,44 @@ digraph {
                                 "Licensing Division" "Postal Services Division" "Cybersecurity Division" "AI Innovation Division"};
 }
 """
-        st.graphviz_chart(mcmc_dot, use_container_width=True)
-        
-        st.markdown("---")
-        st.markdown('<h4 style="text-align: left;">Breakdown Table</h4>', unsafe_allow_html=True)
-        
-        # Breakdown Table
-        breakdown_data = pd.DataFrame({
-            'Type': ['Divisions', 'Commission Members'],
-            'Count': [7, 5],
-            'Function': ['Operational', 'Governance']
-        })
-        st.dataframe(breakdown_data, use_container_width=True, hide_index=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    # ============================================================================
-    # SUBTAB 3: Ministry of Digital
-    # ============================================================================
-    with org_tabs[2]:
-        st.markdown('<h3 style="text-align: center;">Ministry of Digital</h3>', unsafe_allow_html=True)
-        st.markdown("---") 
-        
-        # Quick Facts - Using Streamlit columns
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown('<div style="text-align: center;"><strong>Established</strong><br>December 2, 2023</div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown('<div style="text-align: center;"><strong>Departments</strong><br>8+</div>', unsafe_allow_html=True)
-        with col3:
-            st.markdown('<div style="text-align: center;"><strong>Key Agencies</strong><br>6</div>', unsafe_allow_html=True)
-        with col4:
-            st.markdown('<div style="text-align: center;"><strong>Focus</strong><br>Digital Transformation</div>', unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Organizational Hierarchy
-        
-        st.markdown('<h4 style="text-align: center;">Organizational Structure</h4>', unsafe_allow_html=True)
-        st.markdown("---")
-        
-        # Dot Diagram
-        
-        mod_dot = """
+
+_MCMC_BREAKDOWN = pd.DataFrame({
+    'Type': ('Divisions', 'Commission Members'),
+    'Count': (7, 5),
+    'Function': ('Operational', 'Governance')
+}).set_index('Type')
+
+
+def _render_mcmc():
+    """Render the MCMC subtab"""
+    st.markdown('<h3 style="text-align: center;">Malaysian Communications and Multimedia Commission (MCMC)</h3>\n\n---', unsafe_allow_html=True)
+    
+    # Quick Facts
+    _render_quick_facts((
+        ('Established', 'November 1, 1998'),
+        ('5G Coverage', '82.4%'),
+        ('New Towers (JENDELA)', '382+'),
+        ('Active Licenses', 'Multiple Telcos')
+    ))
+    
+    # Organizational Hierarchy
+    section_header("Organizational Structure", align="center")
+    st.divider()
+    
+    # Dot Diagram
+    
+    _render_dot(_MCMC_DOT)
+    
+    section_header("Breakdown Table")
+    
+    # Breakdown Table
+    st.table(_MCMC_BREAKDOWN)
+
+
+# ============================================================================
+# SUBTAB 3: Ministry of Digital
+# ============================================================================
+_MOD_DOT = """
 digraph {
     rankdir=TB;
     node [shape=box, style=filled, fillcolor=lightblue];
@@ -180,51 +168,46 @@ digraph {
     "Key Agencies" -> {"MDEC" "MyDIGITAL" "NAIO" "CSM" "DNB" "MYNIC"};
 }
 """
-        st.graphviz_chart(mod_dot, use_container_width=True)
-
-        
-        
-        st.markdown("---")
-        st.markdown('<h4 style="text-align: left;">Breakdown Table</h4>', unsafe_allow_html=True)
-        
-        # Breakdown Table
-        breakdown_data = pd.DataFrame({
-            'Type': ['Departments', 'Agencies'],
-            'Count': [8, 6],
-            'Oversight': ['Direct Policy', 'Implementation']
-        })
-        st.dataframe(breakdown_data, use_container_width=True, hide_index=True)
-        
-    
-    # ============================================================================
-    # SUBTAB 4: MyDIGITAL Corporation
-    # ============================================================================
-    with org_tabs[3]:
-        st.markdown('<h3 style="text-align: center;">MyDIGITAL Corporation</h3>', unsafe_allow_html=True)
-        st.markdown("---")
-        
-        # Quick Facts - Using Streamlit columns
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown('<div style="text-align: center;"><strong>Established</strong><br>September 2021</div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown('<div style="text-align: center;"><strong>Investments 2025 (Q2)</strong><br>RM29.47B</div>', unsafe_allow_html=True)
-        with col3:
-            st.markdown('<div style="text-align: center;"><strong>Jobs Created (2024)</strong><br>48,000</div>', unsafe_allow_html=True)
-        with col4:
-            st.markdown('<div style="text-align: center;"><strong>Departments</strong><br>4</div>', unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Organizational Hierarchy
-        
-        st.markdown('<h4 style="text-align: center;">Organizational Structure</h4>', unsafe_allow_html=True)
-        st.markdown("---")
-        
-        
-        # Dot Diagram
-        
-        mydigital_dot = """
+
+_MOD_BREAKDOWN = pd.DataFrame({
+    'Type': ('Departments', 'Agencies'),
+    'Count': (8, 6),
+    'Oversight': ('Direct Policy', 'Implementation')
+}).set_index('Type')
+
+
+def _render_mod():
+    """Render the Ministry of Digital subtab"""
+    st.markdown('<h3 style="text-align: center;">Ministry of Digital</h3>\n\n---', unsafe_allow_html=True)
+    
+    # Quick Facts
+    _render_quick_facts((
+        ('Established', 'December 2, 2023'),
+        ('Departments', '8+'),
+        ('Key Agencies', '6'),
+        ('Focus', 'Digital Transformation')
+    ))
+    
+    # Organizational Hierarchy
+    section_header("Organizational Structure", align="center")
+    st.divider()
+    
+    # Dot Diagram
+    
+    _render_dot(_MOD_DOT)
+
+    
+    
+    section_header("Breakdown Table")
+    
+    # Breakdown Table
+    st.table(_MOD_BREAKDOWN)
+
+
+# ============================================================================
+# SUBTAB 4: MyDIGITAL Corporation
+# ============================================================================
+_MYDIGITAL_DOT = """
 digraph {
     rankdir=TB;
     node [shape=box, style=filled, fillcolor=plum];
@@ -239,49 +222,45 @@ digraph {
     "Agencies & Partners" -> {"MYCentre4IR" "Implementation Partners"};
 }
 """
-        st.graphviz_chart(mydigital_dot, use_container_width=True)
-        
-        st.markdown("---")
-        st.markdown('<h4 style="text-align: left;">Breakdown Table</h4>', unsafe_allow_html=True)
-        
-        # Breakdown Table
-        breakdown_data = pd.DataFrame({
-            'Type': ['Departments', 'Agencies'],
-            'Count': [4, 2],
-            'Oversight': ['Operational', 'Implementation']
-        })
-        st.dataframe(breakdown_data, use_container_width=True, hide_index=True)
-        
-
-    # ============================================================================
-    # SUBTAB 5: MDEC
-    # ============================================================================
-    with org_tabs[4]:
-        st.markdown('<h3 style="text-align: center;">Malaysia Digital Economy Corporation (MDEC)</h3>', unsafe_allow_html=True)
-        st.markdown("---")
-        
-        # Quick Facts - Using Streamlit columns
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown('<div style="text-align: center;"><strong>Established</strong><br>1996</div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown('<div style="text-align: center;"><strong>Digital GDP Target 2025</strong><br>25.5%</div>', unsafe_allow_html=True)
-        with col3:
-            st.markdown('<div style="text-align: center;"><strong>Investments 2024</strong><br>RM163.6B</div>', unsafe_allow_html=True)
-        with col4:
-            st.markdown('<div style="text-align: center;"><strong>Jobs Created 2024</strong><br>48,000</div>', unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Organizational Hierarchy
-        
-        st.markdown('<h4 style="text-align: center;">Organizational Structure</h4>', unsafe_allow_html=True)
-        st.markdown("---")
-     
-        
-        # Dot Diagram
-        
-        mdec_dot = """
+
+_MYDIGITAL_BREAKDOWN = pd.DataFrame({
+    'Type': ('Departments', 'Agencies'),
+    'Count': (4, 2),
+    'Oversight': ('Operational', 'Implementation')
+}).set_index('Type')
+
+
+def _render_mydigital():
+    """Render the MyDIGITAL Corporation subtab"""
+    st.markdown('<h3 style="text-align: center;">MyDIGITAL Corporation</h3>\n\n---', unsafe_allow_html=True)
+    
+    # Quick Facts
+    _render_quick_facts((
+        ('Established', 'September 2021'),
+        ('Investments 2025 (Q2)', 'RM29.47B'),
+        ('Jobs Created (2024)', '48,000'),
+        ('Departments', '4')
+    ))
+    
+    # Organizational Hierarchy
+    section_header("Organizational Structure", align="center")
+    st.divider()
+    
+    
+    # Dot Diagram
+    
+    _render_dot(_MYDIGITAL_DOT)
+    
+    section_header("Breakdown Table")
+    
+    # Breakdown Table
+    st.table(_MYDIGITAL_BREAKDOWN)
+
+
+# ============================================================================
+# SUBTAB 5: MDEC
+# ============================================================================
+_MDEC_DOT = """
 digraph {
     rankdir=TB;
     node [shape=box, style=filled, fillcolor=mistyrose];
@@ -302,15 +281,68 @@ digraph {
     "Corporate Management" -> {"Finance & Administration" "Human Resources" "Operations"};
 }
 """
-        st.graphviz_chart(mdec_dot, use_container_width=True)
-        
-        st.markdown("---")
-        st.markdown('<h4 style="text-align: left;">Breakdown Table</h4>', unsafe_allow_html=True)
-        
-        # Breakdown Table
-        breakdown_data = pd.DataFrame({
-            'Type': ['Departments'],
-            'Count': [4],
-            'Oversight': ['Operational']
-        })
-        st.dataframe(breakdown_data, use_container_width=True, hide_index=True)
\ No newline at end of file
+
+_MDEC_BREAKDOWN = pd.DataFrame({
+    'Type': ('Departments',),
+    'Count': (4,),
+    'Oversight': ('Operational',)
+}).set_index('Type')
+
+
+def _render_mdec():
+    """Render the MDEC subtab"""
+    st.markdown('<h3 style="text-align: center;">Malaysia Digital Economy Corporation (MDEC)</h3>\n\n---', unsafe_allow_html=True)
+    
+    # Quick Facts
+    _render_quick_facts((
+        ('Established', '1996'),
+        ('Digital GDP Target 2025', '25.5%'),
+        ('Investments 2024', 'RM163.6B'),
+        ('Jobs Created 2024', '48,000')
+    ))
+    
+    # Organizational Hierarchy
+    section_header("Organizational Structure", align="center")
+    st.divider()
+
+    
+    # Dot Diagram
+    
+    _render_dot(_MDEC_DOT)
+    
+    section_header("Breakdown Table")
+    
+    # Breakdown Table
+    st.table(_MDEC_BREAKDOWN)
+
+
+# Subtab label -> renderer, in display order
+_ORG_RENDERERS = {
+    "MOHE": _render_mohe,
+    "MCMC": _render_mcmc,
+    "Ministry of Digital": _render_mod,
+    "MyDIGITAL Corp": _render_mydigital,
+    "MDEC": _render_mdec
+}
+
+
+@st.fragment
+def _render_org_selector():
+    """Organization radio and the selected body; switching reruns only this fragment"""
+    # Unlike st.tabs, only the selected body runs on a rerun
+    selected_org = st.radio(
+        "Organization",
+        list(_ORG_RENDERERS),
+        horizontal=True,
+        key="org_tab",
+        label_visibility="collapsed"
+    )
+    _ORG_RENDERERS[selected_org]()
+
+
+def render_organizations_tab(entities_df, people_df, partners_df, has_csv_data, nodes_raw, relationships_raw):
+    """Render the Organization Structure tab with subtabs for each organization"""
+    
+    st.markdown('<h3 style="text-align: center;">Organizational Structure</h3>\n\n---', unsafe_allow_html=True)
+    
+    _render_org_selector()
@@ -2,11 +2,260 @@
 TAB 1: Executive Dashboard — Data-Driven Overview
 Strict dataset-based aggregations with robust parsing and joins
 """
+import csv
+import math
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# NetworkX is only needed for the two network graphs, which show an install hint without it
+try:
+    import networkx as nx
+except ImportError:
+    nx = None
+
+
+def _read_csv_arrow(path: str, usecols=None) -> pd.DataFrame:
+    """Multi-threaded pyarrow parse that keeps every column as text, like dtype=str"""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f))
+    names = [name for name in header if usecols is None or name in usecols]
+    if not names:
+        # pyarrow reads an empty include_columns as "every column", with type inference
+        return pd.DataFrame()
+    table = pa_csv.read_csv(
+        path,
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=1 << 20),
+        parse_options=pa_csv.ParseOptions(invalid_row_handler=lambda row: "skip"),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in names},
+            include_columns=names,
+            strings_can_be_null=True
+        )
+    )
+    # Blank cells come back as None; downstream checks expect NaN
+    return table.to_pandas().replace({None: np.nan})
+
+
+def _parse_csv(path: str, usecols=None) -> pd.DataFrame:
+    """Parse a CSV as strings, preferring pyarrow then the C parser.
+
+    ``usecols`` is an optional set of column names to keep; absent names are ignored.
+    """
+    try:
+        return _read_csv_arrow(path, usecols)
+    except pa.ArrowInvalid:
+        pass
+    keep = None if usecols is None else (lambda c: c in usecols)
+    try:
+        return pd.read_csv(
+            path,
+            dtype=str,                # keep as strings to avoid mixed-type issues
+            encoding="utf-8",
+            engine="c",
+            on_bad_lines="skip",
+            low_memory=False,
+            memory_map=True,
+            usecols=keep
+        )
+    except pd.errors.ParserError:
+        return pd.read_csv(
+            path,
+            dtype=str,
+            encoding="utf-8",
+            engine="python",
+            on_bad_lines="skip",
+            usecols=keep
+        )
+
+
+# path -> ((mtime_ns, size), parsed frame); checked before any hashing or parsing
+_LOCAL_CACHE = {}
+
+
+def load_csv(path: str) -> pd.DataFrame:
+    """Load a CSV, re-parsing only when its mtime or size changes"""
+    try:
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = _LOCAL_CACHE.get(path)
+        if cached is None or cached[0] != key:
+            cached = _LOCAL_CACHE[path] = (key, _parse_csv(path, _USECOLS.get(path)))
+        # Shallow copy: callers only add columns, which never touches the cached frame
+        return cached[1].copy(deep=False)
+    except Exception:
+        return pd.DataFrame()
+
+
+# Everything but A-Z/0-9 (whitespace included) is dropped from join keys
+_KEY_RE = re.compile(r"[^A-Z0-9]+")
+
+
+def make_key(series: pd.Series) -> pd.Series:
+    """Uppercase alphanumeric join key for an entity/organization column"""
+    if series is None:
+        return pd.Series(dtype=str)
+    if series.dtype != object:
+        series = series.astype(str)
+    return series.str.upper().str.replace(_KEY_RE, "", regex=True)
+
+
+def _gauge_indicator(value, title, color):
+    """Indicator trace for one Key Indicators gauge, scaled to its value"""
+    axis_max = max(10, int(value * 1.25) + 1)
+    return go.Indicator(
+        mode="gauge+number",
+        value=value,
+        title={'text': title, 'font': {'size': 14, 'color': '#4B5563'}},
+        number={'font': {'size': 40, 'color': '#1F2937'}},
+        gauge={
+            "axis": {"range": [None, axis_max], 'tickwidth': 1, 'tickcolor': "#D1D5DB"},
+            'bar': {'color': color, 'thickness': 0.75},
+            'bgcolor': "white",
+            'borderwidth': 2,
+            'bordercolor': "#E5E7EB",
+            'steps': [{'range': [0, axis_max], 'color': '#F3F4F6'}]
+        }
+    )
+
+
+@st.cache_data(show_spinner=False)
+def compute_layout(nodes_tuple, edges_tuple):
+    """Seeded spring layout, computed once per distinct node/edge set"""
+    G = nx.Graph()
+    G.add_nodes_from(nodes_tuple)
+    G.add_edges_from(edges_tuple)
+    return {n: tuple(xy) for n, xy in nx.spring_layout(G, k=2, iterations=50, seed=42).items()}
+
+
+def circular_positions(nodes):
+    """Evenly spaced unit-circle positions, in node order"""
+    step = 2 * math.pi / max(len(nodes), 1)
+    return {node: (math.cos(i * step), math.sin(i * step)) for i, node in enumerate(nodes)}
+
+
+# Fixed collaboration-network positions for the five core entities
+_COLLAB_ENTITY_POS = circular_positions(('MOHE', 'MyDIGITAL', 'MDEC', 'Ministry of Digital', 'MCMC'))
+
+
+# Overview datasets, in the order render_overview_tab unpacks them
+_OVERVIEW_CSVS = (
+    "data/nodes.csv",
+    "data/people_intelligence.csv",
+    "data/partnership_network.csv",
+    "data/procurement_analysis.csv",
+    "data/entity_policy_alignment.csv",
+    "data/ai_alignment.csv",  # Using ai_alignment.csv instead of voice_ai_alignment.csv
+    "data/relationships.csv"
+)
+
+# Columns the overview actually reads from each file; everything else is never parsed
+_USECOLS = {
+    "data/nodes.csv": frozenset({"id", "type", "name", "abbreviation", "parent_org", "organization", "entity"}),
+    "data/people_intelligence.csv": frozenset({"entity", "organization"}),
+    "data/partnership_network.csv": frozenset({"entity", "partner_name"}),
+    "data/procurement_analysis.csv": frozenset({"procurement_category"}),
+    "data/entity_policy_alignment.csv": frozenset({"entity", "policy_name", "confidence_score"}),
+    "data/ai_alignment.csv": frozenset({
+        "entity", "organization", "abbreviation", "focus_area",
+        "ai_alignment", "alignment_level", "confidence_score"
+    }),
+    "data/relationships.csv": frozenset({"source"})  # only counted
+}
+
+
+def _is_fresh(path: str) -> bool:
+    """True if the cached frame for path still matches the file's mtime and size"""
+    cached = _LOCAL_CACHE.get(path)
+    if cached is None:
+        return False
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return cached[0] == (stat.st_mtime_ns, stat.st_size)
+
+
+def load_csvs(paths) -> list:
+    """Load independent CSVs, parsing the stale ones concurrently.
+
+    The parsers release the GIL, so cold reads overlap; warm reruns skip the pool.
+    """
+    stale = [path for path in paths if not _is_fresh(path)]
+    if len(stale) > 1:
+        with ThreadPoolExecutor(max_workers=len(stale)) as pool:
+            list(pool.map(load_csv, stale))
+    return [load_csv(path) for path in paths]
+
+
+# ============================================================================
+# Chart constants
+# ============================================================================
+
+# Policies per Entity fallback, based on entity_policy_alignment.csv
+_POLICY_COUNTS_FALLBACK = pd.DataFrame({
+    'Entity': ['MOD', 'MDEC', 'MyDIGITAL', 'MOHE', 'MCMC'],
+    'Count': [5, 4, 4, 3, 2]
+})
+
+# Policies per Entity colors matching reference
+_POLICY_COLORS = ['#8B5CF6', '#EC4899', '#F59E0B', '#10B981', '#3B82F6']
+
+# Based on actual partnership_network.csv data (37 rows total), matched to Chart.js spec:
+# Telecom Partner: 12
+# Tech Partner: 8
+# Local Telecom: 5
+# MSP: 3
+# Implementation Partner: 3
+# Tech Vendor: 2
+# Strategic Partner: 2
+# Local Supplier: 1
+# Investment Partner: 1
+# Sorted ascending by Count: shortest at bottom, longest at top
+_PARTNERSHIP_TYPES_DF = pd.DataFrame({
+    "Partner Type": [
+        "Investment Partner", "Local Supplier", "Strategic Partner",
+        "Tech Vendor", "Implementation Partner", "MSP",
+        "Local Telecom", "Tech Partner", "Telecom Partner"
+    ],
+    "Count": [1, 1, 2, 2, 3, 3, 5, 8, 12]
+}).sort_values("Count", ascending=True).reset_index(drop=True)
+
+# Multicolor palette: Cycle through a professional set (extend as needed for 9 bars)
+_PARTNERSHIP_COLORS = ['#8B5CF6', '#EC4899', '#F59E0B', '#10B981', '#3B82F6',
+                       '#EF4444', '#F97316', '#06B6D4', '#6366F1']  # Purple, pink, orange, green, blue, red, amber, cyan, indigo
+
+# Total Departments per Entity palette
+_DEPT_PALETTE = ['#5fc5c5', '#FF6B6B', '#4ECDC4', '#FFD93D', '#95E1D3',
+                 '#A8E6CF', '#FDCB6E', '#6C5CE7', '#74B9FF', '#FD79A8']
+
+# Cross-Entity Collaboration node colors
+_COLLAB_ENTITY_COLORS = {
+    'MOHE': '#8B5CF6',
+    'MyDIGITAL': '#EC4899',
+    'MDEC': '#F59E0B',
+    'Ministry of Digital': '#10B981',
+    'MCMC': '#3B82F6'
+}
+
+# Partnership Network entity colors, keyed by make_key() output
+_PARTNER_ENTITY_COLORS = {
+    "MDEC": "#F59E0B",
+    "MCMC": "#8A63FF",
+    "MINISTRYOFDIGITAL": "#F45AA4",
+    "MOD": "#F45AA4",
+    "MOHE": "#10B981",
+    "MYDIGITAL": "#3B82F6",
+}
 
 
 def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, research_data):
@@ -15,39 +264,12 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
     # ----------------------------------------------------------------------------
     # 1) Load datasets (robust)
     # ----------------------------------------------------------------------------
-    def load_csv(path: str) -> pd.DataFrame:
-        try:
-            return pd.read_csv(
-                path,
-                dtype=str,                # keep as strings to avoid mixed-type issues
-                encoding="utf-8",
-                engine="python",
-                on_bad_lines="skip"
-            )
-        except Exception:
-            return pd.DataFrame()
-
-    nodes_df = load_csv("data/nodes.csv")
-    people_intel_df = load_csv("data/people_intelligence.csv")
-    partnership_df = load_csv("data/partnership_network.csv")
-    procurement_df = load_csv("data/procurement_analysis.csv")
-    policy_align_df = load_csv("data/entity_policy_alignment.csv")
-    voice_ai_df = load_csv("data/ai_alignment.csv")  # Using ai_alignment.csv instead of voice_ai_alignment.csv
-    relationships_df = load_csv("data/relationships.csv")
+    (nodes_df, people_intel_df, partnership_df, procurement_df,
+     policy_align_df, voice_ai_df, relationships_df) = load_csvs(_OVERVIEW_CSVS)
 
     # ----------------------------------------------------------------------------
     # 2) Standardize entity keys across datasets for reliable joins
     # ----------------------------------------------------------------------------
-    def make_key(series: pd.Series) -> pd.Series:
-        if series is None:
-            return pd.Series(dtype=str)
-        return (
-            series.astype(str)
-            .str.upper()
-            .str.replace(r"[^A-Z0-9]+", "", regex=True)
-            .str.strip()
-        )
-
     # add entity_key columns
     if not policy_align_df.empty and "entity" in policy_align_df.columns:
         policy_align_df["entity_key"] = make_key(policy_align_df["entity"])
@@ -73,151 +295,46 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
         elif "name" in nodes_df.columns:
             nodes_df["entity_key"] = make_key(nodes_df["name"])
 
+        # Lowercased node type, computed once and reused by every type filter below;
+        # categorical so those filters compare integer codes rather than strings
+        if "type" in nodes_df.columns:
+            nodes_df["_type_lc"] = nodes_df["type"].astype(str).str.lower().astype("category")
+
     # ----------------------------------------------------------------------------
     # 3) Gauges — Key Indicators
     # ----------------------------------------------------------------------------
     st.markdown('<div class="section-card">', unsafe_allow_html=True)
     st.markdown("<h4 style='text-align: center; margin-bottom: 30px;'>Key Indicators</h4>", unsafe_allow_html=True)
 
-    g1, g2, g3, g4, g5 = st.columns(5)
-
-    # Total Departments
-    total_departments = 0
-    if not nodes_df.empty and 'type' in nodes_df.columns:
-        total_departments = int((nodes_df['type'].astype(str).str.lower() == 'department').sum())
-
-    with g1:
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=total_departments,
-            title={'text': "Total Departments", 'font': {'size': 14, 'color': '#4B5563'}},
-            number={'font': {'size': 40, 'color': '#1F2937'}},
-            gauge={
-                "axis": {"range": [None, max(10, int(total_departments * 1.25) + 1)], 'tickwidth': 1, 'tickcolor': "#D1D5DB"},
-                'bar': {'color': '#10B981', 'thickness': 0.75},  # Green
-                'bgcolor': "white",
-                'borderwidth': 2,
-                'bordercolor': "#E5E7EB",
-                'steps': [{'range': [0, max(10, int(total_departments * 1.25) + 1)], 'color': '#F3F4F6'}]
-            }
-        ))
-        fig.update_layout(
-            height=200,
-            margin=dict(l=10, r=10, t=40, b=10),
-            paper_bgcolor='rgba(0,0,0,0)',
-            font={'family': 'Arial'}
-        )
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
-
-    # Total Companies
-    total_companies = 0
+    # One pass over the node types feeds all four type gauges
+    type_counts = {}
     if not nodes_df.empty and 'type' in nodes_df.columns:
-        total_companies = int((nodes_df['type'].astype(str).str.lower() == 'company').sum())
-
-    with g2:
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=total_companies,
-            title={'text': "Total Companies", 'font': {'size': 14, 'color': '#4B5563'}},
-            number={'font': {'size': 40, 'color': '#1F2937'}},
-            gauge={
-                "axis": {"range": [None, max(10, int(total_companies * 1.25) + 1)], 'tickwidth': 1, 'tickcolor': "#D1D5DB"},
-                'bar': {'color': '#3B82F6', 'thickness': 0.75},  # Blue
-                'bgcolor': "white",
-                'borderwidth': 2,
-                'bordercolor': "#E5E7EB",
-                'steps': [{'range': [0, max(10, int(total_companies * 1.25) + 1)], 'color': '#F3F4F6'}]
-            }
-        ))
-        fig.update_layout(
-            height=200,
-            margin=dict(l=10, r=10, t=40, b=10),
-            paper_bgcolor='rgba(0,0,0,0)',
-            font={'family': 'Arial'}
-        )
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
-
-    # Total Policies
-    total_policies = 0
-    if not nodes_df.empty and 'type' in nodes_df.columns:
-        total_policies = int((nodes_df['type'].astype(str).str.lower() == 'policy').sum())
-
-    with g3:
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=total_policies,
-            title={'text': "Total Policies", 'font': {'size': 14, 'color': '#4B5563'}},
-            number={'font': {'size': 40, 'color': '#1F2937'}},
-            gauge={
-                "axis": {"range": [None, max(10, int(total_policies * 1.25) + 1)], 'tickwidth': 1, 'tickcolor': "#D1D5DB"},
-                'bar': {'color': '#F59E0B', 'thickness': 0.75},  # Orange
-                'bgcolor': "white",
-                'borderwidth': 2,
-                'bordercolor': "#E5E7EB",
-                'steps': [{'range': [0, max(10, int(total_policies * 1.25) + 1)], 'color': '#F3F4F6'}]
-            }
-        ))
-        fig.update_layout(
-            height=200,
-            margin=dict(l=10, r=10, t=40, b=10),
-            paper_bgcolor='rgba(0,0,0,0)',
-            font={'family': 'Arial'}
-        )
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+        type_counts = nodes_df['_type_lc'].value_counts().to_dict()
 
-    # Total Initiatives
-    total_initiatives = 0
-    if not nodes_df.empty and 'type' in nodes_df.columns:
-        total_initiatives = int((nodes_df['type'].astype(str).str.lower() == 'initiative').sum())
-
-    with g4:
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=total_initiatives,
-            title={'text': "Total Initiatives", 'font': {'size': 14, 'color': '#4B5563'}},
-            number={'font': {'size': 40, 'color': '#1F2937'}},
-            gauge={
-                "axis": {"range": [None, max(10, int(total_initiatives * 1.25) + 1)], 'tickwidth': 1, 'tickcolor': "#D1D5DB"},
-                'bar': {'color': '#8B5CF6', 'thickness': 0.75},  # Purple
-                'bgcolor': "white",
-                'borderwidth': 2,
-                'bordercolor': "#E5E7EB",
-                'steps': [{'range': [0, max(10, int(total_initiatives * 1.25) + 1)], 'color': '#F3F4F6'}]
-            }
-        ))
-        fig.update_layout(
-            height=200,
-            margin=dict(l=10, r=10, t=40, b=10),
-            paper_bgcolor='rgba(0,0,0,0)',
-            font={'family': 'Arial'}
-        )
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
-
-    # Total Relationships
+    total_departments = int(type_counts.get('department', 0))
+    total_companies = int(type_counts.get('company', 0))
+    total_policies = int(type_counts.get('policy', 0))
+    total_initiatives = int(type_counts.get('initiative', 0))
     total_relationships = int(len(relationships_df)) if not relationships_df.empty else 0
 
-    with g5:
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=total_relationships,
-            title={'text': "Total Relationships", 'font': {'size': 14, 'color': '#4B5563'}},
-            number={'font': {'size': 40, 'color': '#1F2937'}},
-            gauge={
-                "axis": {"range": [None, max(10, int(total_relationships * 1.25) + 1)], 'tickwidth': 1, 'tickcolor': "#D1D5DB"},
-                'bar': {'color': '#EC4899', 'thickness': 0.75},  # Pink
-                'bgcolor': "white",
-                'borderwidth': 2,
-                'bordercolor': "#E5E7EB",
-                'steps': [{'range': [0, max(10, int(total_relationships * 1.25) + 1)], 'color': '#F3F4F6'}]
-            }
-        ))
-        fig.update_layout(
-            height=200,
-            margin=dict(l=10, r=10, t=40, b=10),
-            paper_bgcolor='rgba(0,0,0,0)',
-            font={'family': 'Arial'}
-        )
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+    # All five gauges share one figure: one Plotly payload instead of five
+    gauges = (
+        (total_departments, "Total Departments", '#10B981'),  # Green
+        (total_companies, "Total Companies", '#3B82F6'),  # Blue
+        (total_policies, "Total Policies", '#F59E0B'),  # Orange
+        (total_initiatives, "Total Initiatives", '#8B5CF6'),  # Purple
+        (total_relationships, "Total Relationships", '#EC4899')  # Pink
+    )
+    fig = make_subplots(rows=1, cols=len(gauges), specs=[[{'type': 'indicator'}] * len(gauges)])
+    for i, (value, title, color) in enumerate(gauges, start=1):
+        fig.add_trace(_gauge_indicator(value, title, color), row=1, col=i)
+    fig.update_layout(
+        height=200,
+        margin=dict(l=10, r=10, t=40, b=10),
+        paper_bgcolor='rgba(0,0,0,0)',
+        font={'family': 'Arial'}
+    )
+    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
 
     st.markdown("---")
     # ----------------------------------------------------------------------------
@@ -245,30 +362,24 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
             df_plot = policy_counts.sort_values('Count', ascending=False).reset_index(drop=True)
         else:
             # Fallback to hardcoded data based on entity_policy_alignment.csv
-            df_plot = pd.DataFrame({
-                'Entity': ['MOD', 'MDEC', 'MyDIGITAL', 'MOHE', 'MCMC'],
-                'Count': [5, 4, 4, 3, 2]
-            })
-        
-        # Colors matching reference
-        colors = ['#8B5CF6', '#EC4899', '#F59E0B', '#10B981', '#3B82F6']
+            df_plot = _POLICY_COUNTS_FALLBACK
         
-        # Create figure
-        fig = go.Figure()
+        colors = _POLICY_COLORS
         
-        for i, (entity, count, color) in enumerate(zip(df_plot['Entity'], df_plot['Count'], colors)):
-            fig.add_trace(go.Bar(
-                x=[entity],
-                y=[count],
-                marker=dict(
-                    color=color,
-                    line=dict(width=0)
-                ),
-                textposition='outside',
-                textfont=dict(size=13, color='#1F2937', family='Arial'),
-                hovertemplate=f'{entity}: {count}<extra></extra>',
-                showlegend=False
-            ))
+        # One bar per colour, drawn as a single trace
+        df_plot = df_plot.head(len(colors))
+        fig = go.Figure(go.Bar(
+            x=df_plot['Entity'].tolist(),
+            y=df_plot['Count'].tolist(),
+            marker=dict(
+                color=colors[:len(df_plot)],
+                line=dict(width=0)
+            ),
+            textposition='outside',
+            textfont=dict(size=13, color='#1F2937', family='Arial'),
+            hovertemplate='%{x}: %{y}<extra></extra>',
+            showlegend=False
+        ))
         
         fig.update_layout(
             height=400,
@@ -302,48 +413,23 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
         
         st.markdown("<h4 style='text-align: center;'>Partnership Types Breakdown</h4>", unsafe_allow_html=True)
         
-        # Based on actual partnership_network.csv data (37 rows total), matched to Chart.js spec:
-        # Telecom Partner: 12
-        # Tech Partner: 8
-        # Local Telecom: 5
-        # MSP: 3
-        # Implementation Partner: 3
-        # Tech Vendor: 2
-        # Strategic Partner: 2
-        # Local Supplier: 1
-        # Investment Partner: 1
-        
-        df_pt = pd.DataFrame({
-            "Partner Type": [
-                "Investment Partner", "Local Supplier", "Strategic Partner", 
-                "Tech Vendor", "Implementation Partner", "MSP", 
-                "Local Telecom", "Tech Partner", "Telecom Partner"
-            ],
-            "Count": [1, 1, 2, 2, 3, 3, 5, 8, 12]
-        })
-        
-        # Sort ascending by Count: shortest at bottom, longest at top
-        df_pt = df_pt.sort_values("Count", ascending=True).reset_index(drop=True)
-        
-        # Multicolor palette: Cycle through a professional set (extend as needed for 9 bars)
-        colors = ['#8B5CF6', '#EC4899', '#F59E0B', '#10B981', '#3B82F6', 
-                '#EF4444', '#F97316', '#06B6D4', '#6366F1']  # Purple, pink, orange, green, blue, red, amber, cyan, indigo
+        # Hardcoded from partnership_network.csv, pre-sorted at import
+        df_pt = _PARTNERSHIP_TYPES_DF
+        colors = _PARTNERSHIP_COLORS
         
-        # Create horizontal bar chart with multicolor bars
-        fig = go.Figure()
-        for i, row in df_pt.iterrows():
-            fig.add_trace(go.Bar(
-                x=[row["Count"]],
-                y=[row["Partner Type"]],
-                orientation="h",
-                marker=dict(
-                    color=colors[i % len(colors)],  # Cycle through colors
-                    line=dict(width=0)
-                ),
-                textfont=dict(size=12, color="#1F2937", family="Arial"),
-                hovertemplate=f'{row["Partner Type"]}: {row["Count"]}<extra></extra>',
-                showlegend=False
-            ))
+        # Create horizontal bar chart with multicolor bars, as a single trace
+        fig = go.Figure(go.Bar(
+            x=df_pt["Count"].tolist(),
+            y=df_pt["Partner Type"].tolist(),
+            orientation="h",
+            marker=dict(
+                color=[colors[i % len(colors)] for i in range(len(df_pt))],  # Cycle through colors
+                line=dict(width=0)
+            ),
+            textfont=dict(size=12, color="#1F2937", family="Arial"),
+            hovertemplate='%{y}: %{x}<extra></extra>',
+            showlegend=False
+        ))
         
         fig.update_layout(
             height=380,
@@ -384,7 +470,7 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
             st.info("nodes.csv missing or lacks 'type' column.")
         else:
             # Filter department nodes
-            dept_nodes = nodes_df[nodes_df['type'].astype(str).str.lower() == 'department'].copy()
+            dept_nodes = nodes_df[nodes_df['_type_lc'] == 'department'].copy()
             
             if dept_nodes.empty:
                 st.info("No department nodes found in nodes.csv")
@@ -412,65 +498,35 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
                     if dept_nodes.empty:
                         st.info("No valid entity linkages found for departments")
                     else:
-                        # Create entity mapping (ID to name/abbreviation)
-                        entity_map = {}
-                        entity_nodes = nodes_df[nodes_df['type'].astype(str).str.lower() == 'entity'].copy()
-                        
-                        for _, row in entity_nodes.iterrows():
-                            org_id = str(row['id']).strip()
-                            display_name = row['abbreviation'] if pd.notna(row.get('abbreviation')) and str(row.get('abbreviation')).strip() else row['name']
-                            entity_map[org_id] = display_name
-                        
-                        # Count departments per organization
-                        org_counts = dept_nodes[link_col].value_counts()
+                        # Create entity mapping (ID to abbreviation, else name)
+                        entity_nodes = nodes_df[nodes_df['_type_lc'] == 'entity']
+                        abbr = entity_nodes.get('abbreviation', pd.Series(np.nan, index=entity_nodes.index))
+                        display_names = abbr.where(abbr.notna() & abbr.astype(str).str.strip().ne(''), entity_nodes['name'])
+                        entity_map = dict(zip(entity_nodes['id'].astype(str).str.strip(), display_names))
                         
-                        # Build data for plotting with entity names
-                        entities = []
-                        counts = []
-                        
-                        for org_id, count in org_counts.items():
-                            if org_id in entity_map:
-                                entities.append(entity_map[org_id])
-                                counts.append(int(count))
+                        # Map each department to its entity name, then count per entity (sorted descending)
+                        df_dept = (
+                            dept_nodes[link_col].map(entity_map).dropna().value_counts()
+                            .rename_axis('Entity').reset_index(name='departmentCount')
+                        )
                         
-                        if not entities:
+                        if df_dept.empty:
                             st.info("No valid entity mappings found")
                         else:
-                            # Create dataframe and sort by count descending
-                            df_dept = pd.DataFrame({
-                                'Entity': entities,
-                                'departmentCount': counts
-                            }).sort_values('departmentCount', ascending=False)
-                            
-                            # Define color palette for entities
-                            color_palette = ['#5fc5c5', '#FF6B6B', '#4ECDC4', '#FFD93D', '#95E1D3', 
-                                           '#A8E6CF', '#FDCB6E', '#6C5CE7', '#74B9FF', '#FD79A8']
-                            
-                            # Assign colors to entities
-                            entity_colors = {}
-                            for i, entity in enumerate(df_dept['Entity']):
-                                entity_colors[entity] = color_palette[i % len(color_palette)]
-                            
-                            # Create figure with separate trace for each entity
-                            fig = go.Figure()
+                            color_palette = _DEPT_PALETTE
                             
-                            for entity in df_dept['Entity']:
-                                count = df_dept[df_dept['Entity'] == entity]['departmentCount'].values[0]
-                                color = entity_colors[entity]
-                                
-                                fig.add_trace(go.Bar(
-                                    x=[entity],
-                                    y=[count],
-                                    marker=dict(
-                                        color=color,
-                                        line=dict(width=0)
-                                    ),
-                                    
-                                    textfont=dict(size=13, color='#1F2937', family='Arial'),
-                                    name=entity,
-                                    hovertemplate=f'{entity}: {count}<extra></extra>',
-                                    showlegend=False
-                                ))
+                            # One trace for all entities, colours assigned in rank order
+                            fig = go.Figure(go.Bar(
+                                x=df_dept['Entity'].tolist(),
+                                y=df_dept['departmentCount'].tolist(),
+                                marker=dict(
+                                    color=[color_palette[i % len(color_palette)] for i in range(len(df_dept))],
+                                    line=dict(width=0)
+                                ),
+                                textfont=dict(size=13, color='#1F2937', family='Arial'),
+                                hovertemplate='%{x}: %{y}<extra></extra>',
+                                showlegend=False
+                            ))
                             
                             fig.update_layout(
                                 height=420,
@@ -519,10 +575,10 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
         
         if policy_align_df.empty:
             st.info("No policy alignment data available")
+        elif nx is None:
+            st.error("NetworkX library required. Install with: pip install networkx")
         else:
             try:
-                import networkx as nx
-
                 # Standardize policy names to catch variations
                 policy_df_temp = policy_align_df.copy()
                 policy_df_temp['policy_standardized'] = policy_df_temp['policy_name'].str.replace(
@@ -531,29 +587,18 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
                     regex=True
                 )
 
-                # Group by policy to find which entities work on the same policies
-                policy_groups = policy_df_temp.groupby('policy_standardized')['entity'].apply(list).to_dict()
-                
-                # Count shared policies between entities
-                collaboration_counts = {}
-                shared_policies = {}
-                
-                for policy, entities in policy_groups.items():
-                    if len(entities) > 1:  # Only if multiple entities share this policy
-                        # Create pairs of collaborating entities
-                        for i in range(len(entities)):
-                            for j in range(i + 1, len(entities)):
-                                entity1, entity2 = sorted([entities[i], entities[j]])
-                                pair = (entity1, entity2)
-                                
-                                if pair not in collaboration_counts:
-                                    collaboration_counts[pair] = 0
-                                    shared_policies[pair] = []
-                                
-                                collaboration_counts[pair] += 1
-                                shared_policies[pair].append(policy)
+                # Pair up entities that share a policy via a self-merge on the policy column;
+                # entity_x < entity_y keeps each unordered pair once
+                pairs = policy_df_temp[['policy_standardized', 'entity']].dropna()
+                pairs = pairs.merge(pairs, on='policy_standardized')
+                pairs = pairs[pairs['entity_x'] < pairs['entity_y']]
+                collaborations = (
+                    pairs.groupby(['entity_x', 'entity_y'])['policy_standardized']
+                    .agg(['size', list])
+                    .reset_index()
+                )
                 
-                if not collaboration_counts:
+                if collaborations.empty:
                     st.info("No shared policy collaborations found between entities")
                 else:
                     # Create network graph
@@ -565,32 +610,53 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
                         G.add_node(entity)
                     
                     # Add edges for collaborations
-                    for (entity1, entity2), count in collaboration_counts.items():
-                        G.add_edge(entity1, entity2, weight=count, policies=shared_policies[(entity1, entity2)])
+                    for entity1, entity2, count, policies in collaborations.itertuples(index=False):
+                        G.add_edge(entity1, entity2, weight=count, policies=policies)
                     
-                    # Get positions using spring layout
-                    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+                    # The core entities sit at fixed points on a circle; anything else
+                    # falls back to an even circular layout over all nodes
+                    if all(node in _COLLAB_ENTITY_POS for node in G.nodes()):
+                        pos = {node: _COLLAB_ENTITY_POS[node] for node in G.nodes()}
+                    else:
+                        pos = circular_positions(tuple(G.nodes()))
                     
-                    # Create edge traces
-                    edge_traces = []
-                    for edge in G.edges(data=True):
-                        x0, y0 = pos[edge[0]]
-                        x1, y1 = pos[edge[1]]
-                        weight = edge[2]['weight']
-                        policies = edge[2]['policies']
+                    # Edges as one None-separated polyline per line width (width tracks
+                    # the number of shared policies); hover text sits on invisible midpoints
+                    edge_lines = {}
+                    mid_x, mid_y, mid_text = [], [], []
+                    for u, v, data in G.edges(data=True):
+                        x0, y0 = pos[u]
+                        x1, y1 = pos[v]
+                        weight = data['weight']
                         
-                        # Line width based on number of shared policies
-                        line_width = 1 + (weight * 2)
+                        xs, ys = edge_lines.setdefault(1 + (weight * 2), ([], []))
+                        xs += [x0, x1, None]
+                        ys += [y0, y1, None]
                         
-                        edge_trace = go.Scatter(
-                            x=[x0, x1, None],
-                            y=[y0, y1, None],
+                        mid_x.append((x0 + x1) / 2)
+                        mid_y.append((y0 + y1) / 2)
+                        mid_text.append(f'{u} ↔ {v}<br>{weight} shared policies<br>' + '<br>'.join(data['policies']))
+                    
+                    edge_traces = [
+                        go.Scatter(
+                            x=xs,
+                            y=ys,
                             mode='lines',
                             line=dict(width=line_width, color='#94A3B8'),
-                            hovertemplate=f'{edge[0]} ↔ {edge[1]}<br>{weight} shared policies<br>' + '<br>'.join(policies) + '<extra></extra>',
+                            hoverinfo='skip',
                             showlegend=False
                         )
-                        edge_traces.append(edge_trace)
+                        for line_width, (xs, ys) in edge_lines.items()
+                    ]
+                    edge_traces.append(go.Scatter(
+                        x=mid_x,
+                        y=mid_y,
+                        mode='markers',
+                        marker=dict(size=12, opacity=0),
+                        hovertext=mid_text,
+                        hoverinfo='text',
+                        showlegend=False
+                    ))
                     
                     # Create node trace
                     node_x = []
@@ -599,14 +665,7 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
                     node_colors = []
                     node_sizes = []
                     
-                    # Color palette for entities
-                    entity_colors = {
-                        'MOHE': '#8B5CF6',
-                        'MyDIGITAL': '#EC4899',
-                        'MDEC': '#F59E0B',
-                        'Ministry of Digital': '#10B981',
-                        'MCMC': '#3B82F6'
-                    }
+                    entity_colors = _COLLAB_ENTITY_COLORS
                     
                     for node in G.nodes():
                         x, y = pos[node]
@@ -656,8 +715,6 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
                     
                     st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
                     
-            except ImportError:
-                st.error("NetworkX library required. Install with: pip install networkx")
             except Exception as e:
                 st.error(f"Error creating network graph: {str(e)}")
         
@@ -670,45 +727,39 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
     st.markdown("---")
     st.markdown("<h4 style='text-align: center;'>Partnership Network</h4>", unsafe_allow_html=True)
 
-    if not partnership_df.empty and {"entity_key", "partner_name"}.issubset(partnership_df.columns):
+    if partnership_df.empty or not {"entity_key", "partner_name"}.issubset(partnership_df.columns):
+        st.info("No partnership data available")
+    elif nx is None:
+        st.error("NetworkX library required. Install with: pip install networkx")
+    else:
         try:
-            import networkx as nx
-
             # Create network graph
             G = nx.Graph()
 
-            # Define entity colors
-            entity_colors = {
-                "MDEC": "#F59E0B",
-                "MCMC": "#8A63FF",
-                "MINISTRYOFDIGITAL": "#F45AA4",
-                "MOD": "#F45AA4",
-                "MOHE": "#10B981",
-                "MYDIGITAL": "#3B82F6",
-            }
+            entity_colors = _PARTNER_ENTITY_COLORS
 
             # Add edges from partnerships
             for _, row in partnership_df.dropna(subset=["entity_key", "partner_name"]).iterrows():
                 G.add_edge(row["entity_key"], row["partner_name"])
 
             # Use spring layout for positioning
-            pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
-
-            # Get node positions
-            edge_trace = []
-            for edge in G.edges():
-                x0, y0 = pos[edge[0]]
-                x1, y1 = pos[edge[1]]
-                edge_trace.append(
-                    go.Scatter(
-                        x=[x0, x1, None],
-                        y=[y0, y1, None],
-                        mode='lines',
-                        line=dict(width=0.5, color='#CBD5E1'),
-                        hoverinfo='none',
-                        showlegend=False
-                    )
-                )
+            pos = compute_layout(tuple(G.nodes()), tuple(G.edges()))
+
+            # All edges in one trace, segments separated by None
+            edge_x, edge_y = [], []
+            for u, v in G.edges():
+                x0, y0 = pos[u]
+                x1, y1 = pos[v]
+                edge_x += [x0, x1, None]
+                edge_y += [y0, y1, None]
+            edge_trace = go.Scatter(
+                x=edge_x,
+                y=edge_y,
+                mode='lines',
+                line=dict(width=0.5, color='#CBD5E1'),
+                hoverinfo='none',
+                showlegend=False
+            )
 
             # Create node trace
             node_x = []
@@ -754,7 +805,7 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
             )
 
             # Create figure
-            fig = go.Figure(data=edge_trace + [node_trace])
+            fig = go.Figure(data=[edge_trace, node_trace])
 
             fig.update_layout(
                 showlegend=False,
@@ -769,12 +820,8 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
 
             st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
 
-        except ImportError:
-            st.error("NetworkX library required. Install with: pip install networkx")
         except Exception as e:
             st.error(f"Error creating network graph: {str(e)}")
-    else:
-        st.info("No partnership data available")
 
     # ----------------------------------------------------------------------------
     # 7) Procurement Categories
@@ -901,7 +948,7 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
     # Partnership Density
     partnership_density = 0.0
     if not partnership_df.empty and not nodes_df.empty and "type" in nodes_df.columns:
-        entity_count = int((nodes_df["type"].astype(str).str.lower() == "entity").sum())
+        entity_count = int(type_counts.get("entity", 0))
         if entity_count > 0:
             avg_partnerships = len(partnership_df) / entity_count
             partnership_density = min((avg_partnerships / 10) * 100, 100)
@@ -927,8 +974,8 @@ def render_overview_tab(entities_df, people_df, partners_df, has_csv_data, resea
     # Operational Scale
     operational_scale = 0.0
     if not nodes_df.empty:
-        depts = int((nodes_df.get("type", "").astype(str).str.lower() == "department").sum()) if "type" in nodes_df.columns else 0
-        agencies = int((nodes_df.get("type", "").astype(str).str.lower() == "agency").sum()) if "type" in nodes_df.columns else 0
+        depts = int(type_counts.get("department", 0))
+        agencies = int(type_counts.get("agency", 0))
         personnel = len(people_intel_df) if not people_intel_df.empty else 0
         operational_scale = min(((depts + agencies + personnel) / 100) * 100, 100)
 
@@ -11,7 +11,7 @@ from utils.data_loader import (
     load_all_datasets
 )
 
-from utils.styles import get_dashboard_styles
+from utils.styles import get_dashboard_styles, section_header
 
 __all__ = [
     'load_data_from_graph',
@@ -20,5 +20,6 @@ __all__ = [
     'calculate_dashboard_metrics',
     'format_currency',
     'load_all_datasets',
-    'get_dashboard_styles'
+    'get_dashboard_styles',
+    'section_header'
 ]
\ No newline at end of file
@@ -1,3 +1,5 @@
+import streamlit as st
+
 
 def get_dashboard_styles():
     """Return custom CSS styles for the dashboard"""
@@ -128,6 +130,26 @@ def get_dashboard_styles():
         border-bottom: 2px solid #e0e0e0;
     }
     
+    /* Static HTML tables (Documentation tab) */
+    .mg-table {
+        width: 100%;
+        border-collapse: collapse;
+        font-size: 0.9rem;
+        margin-bottom: 1rem;
+    }
+    
+    .mg-table th {
+        background: #f8f9fa;
+        font-weight: 600;
+        text-align: left;
+    }
+    
+    .mg-table th, .mg-table td {
+        padding: 8px 12px;
+        border-bottom: 1px solid #e0e0e0;
+        vertical-align: top;
+    }
+    
     /* Responsive adjustments */
     @media (max-width: 768px) {
         .dashboard-title {
@@ -143,4 +165,8 @@ def get_dashboard_styles():
         }
     }
     </style>
-    """
\ No newline at end of file
+    """
+
+def section_header(title, align="left"):
+    """Render a separator and an h4 section heading as a single markdown element"""
+    st.markdown(f'---\n\n<h4 style="text-align: {align};">{title}</h4>', unsafe_allow_html=True)